@@ -1,54 +1,149 @@
 """Rich terminal output formatting."""
 
+import io
 import json
 import re
+import tempfile
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO
 
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
-from rich.syntax import Syntax
 
-from core.parser import Session, CodeBlock, extract_code_blocks
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+from core.parser import FILE_WRITE_TOOLS, Session, CodeBlock, extract_code_blocks
 from core.search import SearchResult, SessionInfo, ProjectInfo
 
 
 console = Console()
 
+TRANSCRIPT_CACHE_DIR = Path.home() / ".claude-conversations" / "cache"
+TRANSCRIPT_CACHE_SIZE = 256 * 1024 * 1024
+# Bump whenever transcript formatting changes, so cached output goes stale
+TRANSCRIPT_CACHE_VERSION = 2
+# Cached transcripts are read back in blocks of this many characters
+TRANSCRIPT_CACHE_BLOCK_SIZE = 64 * 1024
+# Transcripts being cached spill from memory to a temp file past this size
+_TRANSCRIPT_SPOOL_SIZE = 1024 * 1024
+
+# Characters that can introduce Markdown syntax; text without any of them
+# renders the same as plain text, so the Markdown parser can be skipped
+_MD_SIGNIFICANT = re.compile(r"[#*`_\[>]")
+
+# JSON snippets up to this length skip Pygments highlighting
+_SYNTAX_MIN_LENGTH = 120
+
+# Sessions tables longer than this skip Rich layout even on a terminal
+_PLAIN_TABLE_THRESHOLD = 500
+
+# Plain-text transcript separators
+_HEADER_RULE = "=" * 60 + "\n"
+_MESSAGE_RULE = "-" * 40 + "\n"
+
 
+@lru_cache(maxsize=4096)
 def format_timestamp(ts: Optional[str]) -> str:
     """Format an ISO timestamp for display."""
     if not ts:
         return "N/A"
     try:
-        dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+        # Python < 3.11 can't parse a "Z" suffix; only rebuild the string then
+        iso = ts[:-1] + '+00:00' if ts.endswith('Z') else ts
+        dt = datetime.fromisoformat(iso)
         return dt.strftime("%Y-%m-%d %H:%M")
     except (ValueError, AttributeError):
         return ts[:16] if len(ts) > 16 else ts
 
 
+@lru_cache(maxsize=4096)
 def format_date(ts: Optional[str]) -> str:
     """Format an ISO timestamp as just the date."""
     if not ts:
         return "N/A"
     try:
-        dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+        iso = ts[:-1] + '+00:00' if ts.endswith('Z') else ts
+        dt = datetime.fromisoformat(iso)
         return dt.strftime("%Y-%m-%d")
     except (ValueError, AttributeError):
         return ts[:10] if len(ts) > 10 else ts
 
 
+def _dumps_pretty(obj) -> str:
+    """Serialize an object as indented JSON for display."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # Non-string keys, oversized ints, etc.
+    return json.dumps(obj, indent=2)
+
+
+@lru_cache(maxsize=None)
+def _json_lexer():
+    """Load the Pygments JSON lexer once, skipping the by-name lookup per call."""
+    from pygments.lexers import get_lexer_by_name
+    return get_lexer_by_name("json")
+
+
+def _show_json(input_str: str) -> None:
+    """Print a JSON snippet, highlighting only when it is long enough to help."""
+    if len(input_str) <= _SYNTAX_MIN_LENGTH:
+        console.print(input_str, markup=False)
+        return
+
+    from rich.syntax import Syntax
+    console.print(Syntax(input_str, _json_lexer(), theme="monokai"))
+
+
+def _print_plain_table(headers: list[str], rows: Iterable[tuple]) -> None:
+    """Print rows as tab-separated text, for output that is not a terminal."""
+    write = console.file.write
+    write("\t".join(headers))
+    write("\n")
+    for row in rows:
+        write("\t".join(row))
+        write("\n")
+
+
+def _print_aligned_table(
+    headers: list[str], rows: list[tuple], right: tuple[int, ...] = ()
+) -> None:
+    """Print rows as space-aligned columns without building a Rich Table."""
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    def fmt(row):
+        return "  ".join(
+            cell.rjust(widths[i]) if i in right else cell.ljust(widths[i])
+            for i, cell in enumerate(row)
+        ).rstrip()
+
+    write = console.file.write
+    write(fmt(headers))
+    write("\n")
+    for row in rows:
+        write(fmt(row))
+        write("\n")
+
+
 def truncate(text: str, max_len: int = 80) -> str:
     """Truncate text to max length with ellipsis."""
     if not text:
         return ""
-    text = text.replace('\n', ' ').strip()
+    # Strip before replacing newlines so long text only rewrites what is kept
+    text = text.strip()
     if len(text) <= max_len:
-        return text
-    return text[:max_len - 3] + "..."
+        return text.replace('\n', ' ')
+    return text[:max_len - 3].replace('\n', ' ') + "..."
 
 
 def format_search_results(results: list[SearchResult]) -> None:
@@ -63,7 +158,7 @@ def format_search_results(results: list[SearchResult]) -> None:
         header.append(f"[{result.project}]", style="cyan")
         header.append(f" {format_timestamp(result.timestamp)}", style="dim")
         header.append(f" session ", style="dim")
-        header.append(result.session_id[:8], style="blue")
+        header.append(result.short_id, style="blue")
         console.print(header)
 
         # Format the snippet with highlights
@@ -82,29 +177,40 @@ def format_projects_table(projects: list[ProjectInfo], stats: bool = False) -> N
         console.print("[yellow]No projects found[/yellow]")
         return
 
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("Project", style="cyan", no_wrap=True)
-    table.add_column("Sessions", justify="right")
-    table.add_column("Last Active", style="dim")
-
+    # Pick the row layout once rather than branching per row
     if stats:
-        table.add_column("Messages", justify="right")
-        table.add_column("First Active", style="dim")
-
-    for project in projects:
-        row = [
-            project.name,
-            str(project.session_count),
-            format_date(project.last_active),
-        ]
+        build = lambda p: (
+            p.name,
+            str(p.session_count),
+            format_date(p.last_active),
+            str(p.message_count),
+            format_date(p.first_active),
+        )
+    else:
+        build = lambda p: (p.name, str(p.session_count), format_date(p.last_active))
+
+    if not console.is_terminal:
+        headers = ["Project", "Sessions", "Last Active"]
         if stats:
-            row.extend([
-                str(project.message_count),
-                format_date(project.first_active),
-            ])
-        table.add_row(*row)
+            headers += ["Messages", "First Active"]
+        _print_plain_table(headers, map(build, projects))
+    else:
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Project", style="cyan", no_wrap=True)
+        table.add_column("Sessions", justify="right")
+        table.add_column("Last Active", style="dim")
 
-    console.print(table)
+        if stats:
+            table.add_column("Messages", justify="right")
+            table.add_column("First Active", style="dim")
+
+        add = table.add_row
+        for project in projects:
+            add(*build(project))
+
+        console.print(table)
     console.print(f"\n[dim]{len(projects)} projects[/dim]")
 
 
@@ -114,27 +220,50 @@ def format_sessions_table(sessions: list[SessionInfo], summary: bool = False) ->
         console.print("[yellow]No sessions found[/yellow]")
         return
 
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("Session ID", style="blue", no_wrap=True)
-    table.add_column("Project", style="cyan")
-    table.add_column("Date", style="dim")
-    table.add_column("Messages", justify="right")
-
+    # Pick the row layout once rather than branching per row
     if summary:
-        table.add_column("First Message", max_width=50)
-
-    for session in sessions:
-        row = [
-            session.session_id[:8],
-            session.project,
-            format_date(session.start_time),
-            str(session.message_count),
-        ]
+        build = lambda s: (
+            s.short_id,
+            s.project,
+            format_date(s.start_time),
+            str(s.message_count),
+            truncate(s.first_message or "", 50),
+        )
+    else:
+        build = lambda s: (
+            s.short_id,
+            s.project,
+            format_date(s.start_time),
+            str(s.message_count),
+        )
+
+    if not console.is_terminal:
+        headers = ["Session ID", "Project", "Date", "Messages"]
+        if summary:
+            headers.append("First Message")
+        _print_plain_table(headers, map(build, sessions))
+    elif len(sessions) > _PLAIN_TABLE_THRESHOLD:
+        headers = ["Session ID", "Project", "Date", "Messages"]
         if summary:
-            row.append(truncate(session.first_message or "", 50))
-        table.add_row(*row)
+            headers.append("First Message")
+        _print_aligned_table(headers, [build(s) for s in sessions], right=(3,))
+    else:
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Session ID", style="blue", no_wrap=True)
+        table.add_column("Project", style="cyan")
+        table.add_column("Date", style="dim")
+        table.add_column("Messages", justify="right")
+
+        if summary:
+            table.add_column("First Message", max_width=50)
 
-    console.print(table)
+        add = table.add_row
+        for session in sessions:
+            add(*build(session))
+
+        console.print(table)
     console.print(f"\n[dim]{len(sessions)} sessions[/dim]")
 
 
@@ -153,129 +282,206 @@ def format_transcript(
     Returns:
         Formatted string
     """
+    return "".join(iter_transcript(session, no_tools=no_tools, output_format=output_format))
+
+
+def iter_transcript(
+    session: Session,
+    no_tools: bool = False,
+    output_format: str = "text"
+) -> Iterator[str]:
+    """Yield a formatted session transcript in chunks.
+
+    Text and Markdown are produced one message at a time, so a caller
+    writing the chunks out never holds the whole transcript in memory.
+    With diskcache installed this holds for cached transcripts too: they
+    are spooled to the cache as they stream and read back in blocks.
+    Takes the same arguments as format_transcript().
+    """
+    cache = _transcript_cache()
+    # The output also depends on the formatter itself and on whether orjson
+    # is installed, so both are part of the key
+    key = (
+        TRANSCRIPT_CACHE_VERSION,
+        orjson is not None,
+        session.session_id,
+        no_tools,
+        output_format,
+        session.file_mtime,
+    )
+    if cache is not None:
+        cached = cache.get(key, read=True)
+        if cached is not None:
+            # Entries are stored as files; read them back a block at a time
+            with io.TextIOWrapper(cached, encoding="utf-8", errors="surrogatepass", newline="") as f:
+                yield from iter(lambda: f.read(TRANSCRIPT_CACHE_BLOCK_SIZE), "")
+            return
+
     if output_format == "json":
-        return _format_transcript_json(session, no_tools)
+        chunks = iter((_format_transcript_json(session, no_tools),))
     elif output_format == "md":
-        return _format_transcript_markdown(session, no_tools)
+        chunks = _iter_transcript_markdown(session, no_tools)
     else:
-        return _format_transcript_text(session, no_tools)
+        chunks = _iter_transcript_text(session, no_tools)
 
+    if cache is None:
+        yield from chunks
+        return
 
-def _format_transcript_text(session: Session, no_tools: bool) -> str:
-    """Format transcript as plain text."""
-    lines = []
-    lines.append(f"Session: {session.session_id}")
-    lines.append(f"Project: {session.project}")
-    lines.append(f"Date: {format_timestamp(session.start_time)}")
-    lines.append(f"Messages: {session.message_count}")
-    lines.append("=" * 60)
-    lines.append("")
+    # Spool a copy of what was streamed so it can be cached afterwards; a
+    # caller that stops early leaves nothing cached
+    with tempfile.SpooledTemporaryFile(max_size=_TRANSCRIPT_SPOOL_SIZE) as spool:
+        for chunk in chunks:
+            spool.write(chunk.encode("utf-8", "surrogatepass"))
+            yield chunk
+        spool.seek(0)
+        cache.set(key, spool, read=True)
 
-    for msg in session.messages:
-        # Role header
-        role_display = "USER" if msg.role == "user" else "ASSISTANT"
-        lines.append(f"[{role_display}] {format_timestamp(msg.timestamp)}")
-        lines.append("-" * 40)
+
+@lru_cache(maxsize=None)
+def _transcript_cache():
+    """Open the on-disk transcript cache, or None if diskcache isn't installed.
+
+    Entries are keyed on the session file mtime, so appending to a session
+    invalidates its cached transcripts, and on TRANSCRIPT_CACHE_VERSION.
+    """
+    try:
+        from diskcache import Cache
+    except ImportError:
+        return None
+    return Cache(str(TRANSCRIPT_CACHE_DIR), size_limit=TRANSCRIPT_CACHE_SIZE)
+
+
+def _iter_transcript_text(session: Session, no_tools: bool) -> Iterator[str]:
+    """Yield transcript as plain text, one chunk per message."""
+    yield (
+        f"Session: {session.session_id}\n"
+        f"Project: {session.project}\n"
+        f"Date: {format_timestamp(session.start_time)}\n"
+        f"Messages: {session.message_count}\n"
+        f"{_HEADER_RULE}"
+    )
+
+    for msg, is_user, tool_use, tool_results in session.rendered_rows:
+        parts = []
+        w = parts.append
+
+        # Blank separator, then role header
+        role_display = "USER" if is_user else "ASSISTANT"
+        w(f"\n[{role_display}] {format_timestamp(msg.timestamp)}\n")
+        w(_MESSAGE_RULE)
 
         # Content
         if msg.content:
-            lines.append(msg.content)
+            w(msg.content)
+            w("\n")
 
         # Tool calls (if not suppressed)
-        if not no_tools and msg.tool_use:
-            for tool in msg.tool_use:
-                lines.append(f"\n<tool_use name=\"{tool['name']}\">")
-                if tool.get("input"):
-                    lines.append(json.dumps(tool["input"], indent=2))
-                lines.append("</tool_use>")
+        if not no_tools and tool_use:
+            for tool in tool_use:
+                w(f"\n<tool_use name=\"{tool['name']}\">\n")
+                tool_input = tool.get("input")
+                if tool_input:
+                    w(_dumps_pretty(tool_input))
+                    w("\n")
+                w("</tool_use>\n")
 
         # Tool results (if not suppressed)
-        if not no_tools and msg.tool_results:
-            for result in msg.tool_results:
+        if not no_tools and tool_results:
+            for result in tool_results:
                 status = "error" if result.get("is_error") else "success"
-                lines.append(f"\n<tool_result status=\"{status}\">")
+                w(f"\n<tool_result status=\"{status}\">\n")
                 content = result.get("content", "")
                 if len(content) > 500:
-                    lines.append(content[:500] + "...")
+                    w(content[:500])
+                    w("...\n")
                 else:
-                    lines.append(content)
-                lines.append("</tool_result>")
-
-        lines.append("")
-
-    return "\n".join(lines)
-
-
-def _format_transcript_markdown(session: Session, no_tools: bool) -> str:
-    """Format transcript as Markdown."""
-    lines = []
-    lines.append(f"# Session {session.session_id[:8]}")
-    lines.append("")
-    lines.append(f"- **Project:** {session.project}")
-    lines.append(f"- **Date:** {format_timestamp(session.start_time)}")
-    lines.append(f"- **Messages:** {session.message_count}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    for msg in session.messages:
-        # Role header
-        if msg.role == "user":
-            lines.append("## User")
+                    w(content)
+                    w("\n")
+                w("</tool_result>\n")
+
+        yield "".join(parts)
+
+
+def _iter_transcript_markdown(session: Session, no_tools: bool) -> Iterator[str]:
+    """Yield transcript as Markdown, one chunk per message."""
+    yield (
+        f"# Session {session.session_id[:8]}\n\n"
+        f"- **Project:** {session.project}\n"
+        f"- **Date:** {format_timestamp(session.start_time)}\n"
+        f"- **Messages:** {session.message_count}\n"
+        "\n---\n"
+    )
+
+    for msg, is_user, tool_use, tool_results in session.rendered_rows:
+        parts = []
+        w = parts.append
+
+        # Blank separator, then role header
+        if is_user:
+            w("\n## User\n\n")
         else:
-            lines.append("## Assistant")
-
-        lines.append("")
+            w("\n## Assistant\n\n")
 
         # Content
         if msg.content:
-            lines.append(msg.content)
-            lines.append("")
+            w(msg.content)
+            w("\n\n")
 
         # Tool calls (if not suppressed)
-        if not no_tools and msg.tool_use:
-            for tool in msg.tool_use:
-                lines.append(f"### Tool: {tool['name']}")
-                lines.append("")
-                lines.append("```json")
-                lines.append(json.dumps(tool.get("input", {}), indent=2))
-                lines.append("```")
-                lines.append("")
+        if not no_tools and tool_use:
+            for tool in tool_use:
+                w(f"### Tool: {tool['name']}\n\n")
+                w("```json\n")
+                w(_dumps_pretty(tool.get("input", {})))
+                w("\n```\n\n")
 
         # Tool results (if not suppressed)
-        if not no_tools and msg.tool_results:
-            for result in msg.tool_results:
+        if not no_tools and tool_results:
+            for result in tool_results:
                 status = "Error" if result.get("is_error") else "Result"
-                lines.append(f"### Tool {status}")
-                lines.append("")
-                lines.append("```")
+                w(f"### Tool {status}\n\n")
+                w("```\n")
                 content = result.get("content", "")
                 if len(content) > 1000:
-                    lines.append(content[:1000] + "\n...")
+                    w(content[:1000])
+                    w("\n...")
                 else:
-                    lines.append(content)
-                lines.append("```")
-                lines.append("")
+                    w(content)
+                w("\n```\n\n")
 
-        lines.append("---")
-        lines.append("")
-
-    return "\n".join(lines)
+        w("---\n")
+        yield "".join(parts)
 
 
 def _format_transcript_json(session: Session, no_tools: bool) -> str:
     """Format transcript as JSON."""
-    data = {
+    buf = io.StringIO()
+    write_transcript_json(session, buf, no_tools=no_tools)
+    return buf.getvalue()
+
+
+def write_transcript_json(session: Session, fp: TextIO, no_tools: bool = False) -> None:
+    """Stream a transcript as indented JSON to a file object.
+
+    Produces the same document as ``json.dumps(data, indent=2)`` but
+    serializes one message at a time, so the full transcript is never
+    held in memory as a single string.
+    """
+    header = {
         "session_id": session.session_id,
         "project": session.project,
         "slug": session.slug,
         "start_time": session.start_time,
         "end_time": session.end_time,
         "message_count": session.message_count,
-        "messages": []
     }
+    # Reopen the header object (drop the closing "\n}") to append messages
+    fp.write(json.dumps(header, indent=2)[:-2])
+    fp.write(',\n  "messages": [')
 
-    for msg in session.messages:
+    wrote = False
+    for msg, _, tool_use, tool_results in session.rendered_rows:
         msg_data = {
             "role": msg.role,
             "content": msg.content,
@@ -284,18 +490,24 @@ def _format_transcript_json(session: Session, no_tools: bool) -> str:
         }
 
         if not no_tools:
-            if msg.tool_use:
-                msg_data["tool_use"] = msg.tool_use
-            if msg.tool_results:
-                msg_data["tool_results"] = msg.tool_results
+            if tool_use:
+                msg_data["tool_use"] = tool_use
+            if tool_results:
+                msg_data["tool_results"] = tool_results
 
-        data["messages"].append(msg_data)
+        # JSON strings never contain raw newlines, so re-indenting is safe
+        fp.write(",\n    " if wrote else "\n    ")
+        fp.write(json.dumps(msg_data, indent=2).replace("\n", "\n    "))
+        wrote = True
 
-    return json.dumps(data, indent=2)
+    fp.write("\n  ]\n}" if wrote else "]\n}")
 
 
 def print_transcript(session: Session, no_tools: bool = False) -> None:
     """Print a session transcript with rich formatting."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     # Header panel
     header = f"[bold]Session:[/bold] {session.session_id}\n"
     header += f"[bold]Project:[/bold] {session.project}\n"
@@ -305,9 +517,9 @@ def print_transcript(session: Session, no_tools: bool = False) -> None:
     console.print(Panel(header, title="Session Info", border_style="blue"))
     console.print()
 
-    for msg in session.messages:
+    for msg, is_user, tool_use, tool_results in session.rendered_rows:
         # Role styling
-        if msg.role == "user":
+        if is_user:
             style = "green"
             role_display = "USER"
         else:
@@ -319,7 +531,7 @@ def print_transcript(session: Session, no_tools: bool = False) -> None:
         # Content
         if msg.content:
             # Try to render as markdown for assistant messages
-            if msg.role == "assistant":
+            if msg.role == "assistant" and _MD_SIGNIFICANT.search(msg.content):
                 try:
                     console.print(Markdown(msg.content))
                 except Exception:
@@ -328,46 +540,54 @@ def print_transcript(session: Session, no_tools: bool = False) -> None:
                 console.print(msg.content)
 
         # Tool calls (if not suppressed)
-        if not no_tools and msg.tool_use:
-            for tool in msg.tool_use:
+        if not no_tools and tool_use:
+            for tool in tool_use:
                 console.print(f"\n[yellow]Tool: {tool['name']}[/yellow]")
-                if tool.get("input"):
-                    input_str = json.dumps(tool["input"], indent=2)
+                tool_input = tool.get("input")
+                if tool_input:
+                    input_str = _dumps_pretty(tool_input)
                     if len(input_str) > 500:
                         input_str = input_str[:500] + "\n..."
-                    console.print(Syntax(input_str, "json", theme="monokai"))
+                    _show_json(input_str)
 
         # Tool results (if not suppressed)
-        if not no_tools and msg.tool_results:
-            for result in msg.tool_results:
+        if not no_tools and tool_results:
+            for result in tool_results:
                 if result.get("is_error"):
                     console.print("\n[red]Tool Error:[/red]")
                 else:
                     console.print("\n[dim]Tool Result:[/dim]")
                 content = result.get("content", "")
                 if len(content) > 500:
-                    console.print(content[:500] + "...")
+                    console.print(content[:500], "...", sep="")
                 else:
                     console.print(content)
 
         console.print()
 
 
-def format_code_blocks(blocks: list[CodeBlock], language_filter: Optional[str] = None) -> None:
-    """Print extracted code blocks."""
-    filtered = blocks
+def format_code_blocks(blocks: Iterable[CodeBlock], language_filter: Optional[str] = None) -> None:
+    """Print extracted code blocks.
+
+    Blocks are printed as they are consumed, so a generator can be passed
+    without materializing every block up front.
+    """
     if language_filter:
-        filtered = [b for b in blocks if b.language.lower() == language_filter.lower()]
+        language_filter = language_filter.lower()
+        blocks = (b for b in blocks if b.language.lower() == language_filter)
 
-    if not filtered:
-        console.print("[yellow]No code blocks found[/yellow]")
-        return
+    from rich.syntax import Syntax
 
-    for i, block in enumerate(filtered, 1):
-        console.print(f"\n[bold]Code Block {i}[/bold] [dim]({block.language}, line {block.line_number})[/dim]")
+    count = 0
+    for count, block in enumerate(blocks, 1):
+        console.print(f"\n[bold]Code Block {count}[/bold] [dim]({block.language}, line {block.line_number})[/dim]")
         console.print(Syntax(block.code, block.language or "text", theme="monokai", line_numbers=True))
 
-    console.print(f"\n[dim]{len(filtered)} code blocks[/dim]")
+    if not count:
+        console.print("[yellow]No code blocks found[/yellow]")
+        return
+
+    console.print(f"\n[dim]{count} code blocks[/dim]")
 
 
 def format_stats(stats: dict) -> None:
@@ -376,6 +596,8 @@ def format_stats(stats: dict) -> None:
         console.print("[yellow]Index not found. Run 'claude-conversations reindex' first.[/yellow]")
         return
 
+    from rich.panel import Panel
+
     console.print(Panel.fit(
         f"[bold]Total projects:[/bold] {stats['projects']}\n"
         f"[bold]Total sessions:[/bold] {stats['sessions']}\n"
@@ -390,59 +612,58 @@ def format_stats(stats: dict) -> None:
 
 def format_extracted_files(session: Session) -> None:
     """Print files that were written in a session."""
-    written_files = []
+    rows = []
+    add = rows.append
+    write_tools = FILE_WRITE_TOOLS
 
     for msg in session.messages:
+        timestamp = None
         for tool in msg.tool_use:
-            if tool["name"] in ("Write", "Edit"):
+            name = tool["name"]
+            if name in write_tools:
                 file_path = tool.get("input", {}).get("file_path", "")
                 if file_path:
-                    written_files.append({
-                        "path": file_path,
-                        "tool": tool["name"],
-                        "timestamp": msg.timestamp,
-                    })
+                    if timestamp is None:
+                        timestamp = format_timestamp(msg.timestamp)
+                    add((file_path, name, timestamp))
 
-    if not written_files:
+    if not rows:
         console.print("[yellow]No files written in this session[/yellow]")
         return
 
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("File", style="cyan")
-    table.add_column("Action")
-    table.add_column("Time", style="dim")
+    if not console.is_terminal:
+        _print_plain_table(["File", "Action", "Time"], rows)
+    else:
+        from rich.table import Table
 
-    for f in written_files:
-        table.add_row(f["path"], f["tool"], format_timestamp(f["timestamp"]))
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("File", style="cyan")
+        table.add_column("Action")
+        table.add_column("Time", style="dim")
 
-    console.print(table)
-    console.print(f"\n[dim]{len(written_files)} files[/dim]")
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
+        console.print(table)
 
-def format_extracted_tools(session: Session, tool_filter: Optional[str] = None) -> None:
-    """Print tool calls from a session."""
-    tools = []
+    console.print(f"\n[dim]{len(rows)} files[/dim]")
 
-    for msg in session.messages:
-        for tool in msg.tool_use:
-            if tool_filter and tool["name"] != tool_filter:
-                continue
-            tools.append({
-                "name": tool["name"],
-                "input": tool.get("input", {}),
-                "timestamp": msg.timestamp,
-            })
-
-    if not tools:
-        console.print("[yellow]No matching tool calls found[/yellow]")
-        return
 
-    for i, tool in enumerate(tools, 1):
-        console.print(f"\n[bold yellow]{i}. {tool['name']}[/bold yellow] [dim]{format_timestamp(tool['timestamp'])}[/dim]")
-        if tool["input"]:
-            input_str = json.dumps(tool["input"], indent=2)
+def format_extracted_tools(tools: Iterable[tuple[Optional[str], dict, Optional[str]]]) -> None:
+    """Print (name, input, timestamp) tool calls from a session."""
+    count = 0
+
+    for count, (name, tool_input, timestamp) in enumerate(tools, 1):
+        console.print(f"\n[bold yellow]{count}. {name}[/bold yellow] [dim]{format_timestamp(timestamp)}[/dim]")
+        if tool_input:
+            input_str = _dumps_pretty(tool_input)
             if len(input_str) > 1000:
                 input_str = input_str[:1000] + "\n..."
-            console.print(Syntax(input_str, "json", theme="monokai"))
+            _show_json(input_str)
+
+    if not count:
+        console.print("[yellow]No matching tool calls found[/yellow]")
+        return
 
-    console.print(f"\n[dim]{len(tools)} tool calls[/dim]")
+    console.print(f"\n[dim]{count} tool calls[/dim]")
@@ -1,18 +1,36 @@
 """CLI commands for claude-conversations."""
 
+import itertools
+import os
 import sys
+import time
+from collections import Counter
+from functools import lru_cache
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from core import index, search
-from core.parser import extract_code_blocks, get_projects_dir
-from . import formatter
+# Sessions with more fenced messages than this extract code in a process pool
+PARALLEL_EXTRACT_THRESHOLD = 200
 
+# Minimum seconds between reindex progress repaints
+PROGRESS_REFRESH_INTERVAL = 0.1
 
-console = Console()
+# Incremental reindexes touching fewer sessions than this skip optimizing
+OPTIMIZE_THRESHOLD = 50
+
+# Files and commands listed per section by analyze
+MAX_DISPLAY = 10
+
+
+@lru_cache(maxsize=None)
+def _get_console():
+    """Return the shared Rich console, creating it on first use.
+
+    Rich and the core modules are imported inside the commands that use
+    them, so --help and --version start without loading any of them.
+    """
+    from rich.console import Console
+    return Console()
 
 
 @click.group()
@@ -38,6 +56,11 @@ def search_cmd(query, project, role, limit):
         claude-conversations search "authentication" --project "*webapp*"
         claude-conversations search "how do I" --role user
     """
+    from core import search
+    from . import formatter
+
+    console = _get_console()
+
     try:
         results = search.search(query, project=project, role=role, limit=limit)
         formatter.format_search_results(results)
@@ -59,6 +82,11 @@ def projects(stats):
         claude-conversations projects
         claude-conversations projects --stats
     """
+    from core import search
+    from . import formatter
+
+    console = _get_console()
+
     try:
         project_list = search.get_projects()
         formatter.format_projects_table(project_list, stats=stats)
@@ -82,6 +110,11 @@ def sessions(project, summary, limit):
         claude-conversations sessions my-webapp* --summary
         claude-conversations sessions "*annotation*" -n 20
     """
+    from core import search
+    from . import formatter
+
+    console = _get_console()
+
     try:
         session_list = search.get_sessions(project=project, limit=limit)
         formatter.format_sessions_table(session_list, summary=summary)
@@ -106,15 +139,31 @@ def read(session_id, no_tools, output_format):
         claude-conversations read abc12345 --format md > session.md
         claude-conversations read abc12345 | less
     """
+    from core import search
+    from . import formatter
+
+    console = _get_console()
+
     try:
         session = search.load_session(session_id)
 
         # If outputting to a pipe/file, use plain text format
-        if not sys.stdout.isatty() or output_format != "text":
-            output = formatter.format_transcript(session, no_tools=no_tools, output_format=output_format)
-            print(output)
+        if output_format == "json":
+            formatter.write_transcript_json(session, sys.stdout, no_tools=no_tools)
+            sys.stdout.write("\n")
+        elif not sys.stdout.isatty() or output_format != "text":
+            # Stream message by message rather than building the whole string
+            for chunk in formatter.iter_transcript(session, no_tools=no_tools, output_format=output_format):
+                sys.stdout.write(chunk)
+            sys.stdout.write("\n")
         else:
             formatter.print_transcript(session, no_tools=no_tools)
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); don't let the final
+        # flush at exit raise again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
@@ -140,24 +189,41 @@ def extract(session_id, code, code_lang, files, tool_name):
         claude-conversations extract abc12345 --files
         claude-conversations extract abc12345 --tools Write
     """
-    try:
-        session = search.load_session(session_id)
+    from core import search
+    from core.parser import extract_code_blocks, iter_code_blocks
+    from . import formatter
 
+    console = _get_console()
+
+    try:
         if code or code_lang:
-            # Extract code blocks
-            all_code = []
-            for msg in session.messages:
-                if msg.content:
-                    blocks = extract_code_blocks(msg.content)
-                    all_code.extend(blocks)
+            # Extract code blocks, skipping messages without any fences.
+            # Only message text is needed, so read it from the index rather
+            # than parsing the whole session.
+            contents = [
+                content for content in search.iter_message_contents(session_id)
+                if "```" in content
+            ]
+            if len(contents) > PARALLEL_EXTRACT_THRESHOLD:
+                # Regex scanning is CPU-bound; spread large sessions across cores
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(extract_code_blocks, contents, chunksize=32))
+            else:
+                # Stream blocks straight into the formatter
+                results = map(iter_code_blocks, contents)
+            all_code = itertools.chain.from_iterable(results)
 
             formatter.format_code_blocks(all_code, language_filter=code_lang)
+            return
 
-        elif files:
-            formatter.format_extracted_files(session)
+        if files:
+            formatter.format_extracted_files(search.load_session(session_id))
 
         elif tool_name:
-            formatter.format_extracted_tools(session, tool_filter=tool_name)
+            # Stream only the requested tool's calls instead of parsing
+            # every message in the session
+            formatter.format_extracted_tools(search.iter_tool_calls(session_id, tool_name))
 
         else:
             console.print("[yellow]Specify what to extract: --code, --files, or --tools[/yellow]")
@@ -174,7 +240,8 @@ def extract(session_id, code, code_lang, files, tool_name):
 @cli.command()
 @click.argument("session_id", required=False)
 @click.option("--project", "-p", help="Analyze a project (supports * wildcards)")
-def analyze(session_id, project):
+@click.option("--top", default=15, type=click.IntRange(min=1), help="Number of tools to list for a project")
+def analyze(session_id, project, top):
     """Analyze a session or project for patterns and statistics.
 
     Provides tool usage statistics, file operations, and summary data
@@ -186,12 +253,15 @@ def analyze(session_id, project):
         claude-conversations analyze abc12345
         claude-conversations analyze --project "*webapp*"
         claude-conversations analyze --project cvxr-card-flow
+        claude-conversations analyze --project "*webapp*" --top 5
     """
+    console = _get_console()
+
     try:
         if session_id:
             _analyze_session(session_id)
         elif project:
-            _analyze_project(project)
+            _analyze_project(project, top=top)
         else:
             console.print("[yellow]Specify a session ID or --project flag[/yellow]")
             sys.exit(1)
@@ -203,146 +273,173 @@ def analyze(session_id, project):
         sys.exit(1)
 
 
+def _print_renderables(console, renderables: list) -> None:
+    """Print strings and Rich renderables with a single console call.
+
+    Strings go through render_str() so they get the same markup and
+    highlighting that console.print() would apply to them.
+    """
+    from rich.console import Group
+
+    console.print(Group(*(
+        console.render_str(r) if isinstance(r, str) else r for r in renderables
+    )))
+
+
 def _analyze_session(session_id: str) -> None:
     """Analyze a single session."""
-    session = search.load_session(session_id)
+    from rich.table import Table
+
+    from core import search
+    from core.parser import FILE_WRITE_TOOLS
+    from . import formatter
+
+    console = _get_console()
+
+    info = search.get_session_by_id(session_id)
+    if info is None:
+        raise ValueError(f"Session not found: {session_id}")
 
     # Gather statistics
-    tool_counts = {}
-    files_written = []
+    tool_counts = Counter()
+    # Dicts keep first-seen order while deduplicating as we go
+    files_written: dict[str, None] = {}
     files_read = []
-    commands_run = []
-
-    for msg in session.messages:
-        for tool in msg.tool_use:
-            name = tool["name"]
-            tool_counts[name] = tool_counts.get(name, 0) + 1
-
-            # Track specific tool details
-            input_data = tool.get("input", {})
-            if name == "Write":
-                files_written.append(input_data.get("file_path", "unknown"))
-            elif name == "Edit":
-                files_written.append(input_data.get("file_path", "unknown"))
-            elif name == "Read":
-                files_read.append(input_data.get("file_path", "unknown"))
-            elif name == "Bash":
-                cmd = input_data.get("command", "")
-                if cmd:
-                    commands_run.append(cmd[:80])
+    commands_run: dict[str, None] = {}
+    command_count = 0
+
+    # Stream only the tool calls rather than loading the whole session
+    for name, input_data in search.iter_tool_uses(info.session_id):
+        tool_counts[name] += 1
+
+        # Track specific tool details
+        if name == "Bash":
+            # Most calls in shell-heavy sessions land here, so test it first
+            cmd = input_data.get("command")
+            if cmd:
+                # Only the first few unique commands are ever shown, so
+                # later ones are counted without being sliced
+                if len(commands_run) < MAX_DISPLAY:
+                    commands_run.setdefault(cmd[:80])
+                command_count += 1
+        elif name in FILE_WRITE_TOOLS:
+            files_written.setdefault(input_data.get("file_path", "unknown"))
+        elif name == "Read":
+            files_read.append(input_data.get("file_path", "unknown"))
+
+    # Collect the report and render it in one pass
+    output = []
 
     # Print header
-    console.print(f"\n[bold cyan]Session Analysis: {session.session_id[:8]}[/bold cyan]")
-    console.print(f"[dim]Project:[/dim] {session.project}")
-    console.print(f"[dim]Messages:[/dim] {session.message_count}")
-    console.print(f"[dim]Date:[/dim] {formatter.format_timestamp(session.start_time)}")
+    output.append(
+        f"\n[bold cyan]Session Analysis: {info.short_id}[/bold cyan]\n"
+        f"[dim]Project:[/dim] {info.project}\n"
+        f"[dim]Messages:[/dim] {info.message_count}\n"
+        f"[dim]Date:[/dim] {formatter.format_timestamp(info.start_time)}"
+    )
 
     # Tool usage table
     if tool_counts:
-        console.print("\n[bold]Tool Usage:[/bold]")
+        output.append("\n[bold]Tool Usage:[/bold]")
         table = Table(show_header=True, header_style="bold")
         table.add_column("Tool", style="yellow")
         table.add_column("Count", justify="right")
 
-        for name, count in sorted(tool_counts.items(), key=lambda x: -x[1]):
+        for name, count in tool_counts.most_common():
             table.add_row(name, str(count))
 
-        console.print(table)
+        output.append(table)
 
     # Files modified
     if files_written:
-        console.print("\n[bold]Files Modified:[/bold]")
-        unique_files = list(dict.fromkeys(files_written))  # Preserve order, remove dupes
-        for f in unique_files[:10]:
-            console.print(f"  [cyan]{f}[/cyan]")
-        if len(unique_files) > 10:
-            console.print(f"  [dim]... and {len(unique_files) - 10} more[/dim]")
+        lines = ["\n[bold]Files Modified:[/bold]"]
+        lines.extend(
+            f"  [cyan]{f}[/cyan]" for f in itertools.islice(files_written, MAX_DISPLAY)
+        )
+        if len(files_written) > MAX_DISPLAY:
+            lines.append(f"  [dim]... and {len(files_written) - MAX_DISPLAY} more[/dim]")
+        output.append("\n".join(lines))
 
     # Commands run
     if commands_run:
-        console.print("\n[bold]Commands Run:[/bold]")
-        unique_cmds = list(dict.fromkeys(commands_run))[:10]
-        for cmd in unique_cmds:
-            console.print(f"  [green]{cmd}[/green]")
-        if len(commands_run) > 10:
-            console.print(f"  [dim]... and {len(commands_run) - 10} more[/dim]")
+        lines = ["\n[bold]Commands Run:[/bold]"]
+        lines.extend(f"  [green]{cmd}[/green]" for cmd in commands_run)
+        if command_count > MAX_DISPLAY:
+            lines.append(f"  [dim]... and {command_count - MAX_DISPLAY} more[/dim]")
+        output.append("\n".join(lines))
 
-    console.print()
+    output.append("")
+
+    _print_renderables(console, output)
 
 
-def _analyze_project(project_filter: str) -> None:
+def _analyze_project(project_filter: str, top: int = 15) -> None:
     """Analyze all sessions in a project."""
+    from rich.table import Table
+
+    from core import search
+    from . import formatter
+
+    console = _get_console()
+
     sessions = search.get_sessions(project=project_filter, limit=1000)
 
     if not sessions:
         console.print(f"[yellow]No sessions found matching '{project_filter}'[/yellow]")
         return
 
-    # Aggregate statistics across all sessions
-    total_messages = 0
-    tool_counts = {}
-    all_files_written = []
-
-    for session_info in sessions:
-        total_messages += session_info.message_count
-
-        # Load each session for detailed analysis
-        try:
-            session = search.load_session(session_info.session_id)
-            for msg in session.messages:
-                for tool in msg.tool_use:
-                    name = tool["name"]
-                    tool_counts[name] = tool_counts.get(name, 0) + 1
-
-                    if name in ("Write", "Edit"):
-                        fp = tool.get("input", {}).get("file_path", "")
-                        if fp:
-                            all_files_written.append(fp)
-        except (ValueError, RuntimeError):
-            continue  # Skip sessions that can't be loaded
+    # Aggregate statistics across all sessions from the index
+    total_messages = sum(s.message_count for s in sessions)
+    tool_counts, file_counts = search.aggregate_tool_usage(
+        [s.session_id for s in sessions]
+    )
 
     # Get project name from first session
     project_name = sessions[0].project if sessions else project_filter
 
-    # Print header
-    console.print(f"\n[bold cyan]Project Analysis: {project_name}[/bold cyan]")
-    console.print(f"[dim]Sessions:[/dim] {len(sessions)}")
-    console.print(f"[dim]Total Messages:[/dim] {total_messages}")
+    # Collect the report and render it in one pass
+    output = []
 
+    # Print header
+    lines = [
+        f"\n[bold cyan]Project Analysis: {project_name}[/bold cyan]",
+        f"[dim]Sessions:[/dim] {len(sessions)}",
+        f"[dim]Total Messages:[/dim] {total_messages}",
+    ]
     if sessions:
-        console.print(f"[dim]Date Range:[/dim] {formatter.format_date(sessions[-1].start_time)} to {formatter.format_date(sessions[0].start_time)}")
+        lines.append(f"[dim]Date Range:[/dim] {formatter.format_date(sessions[-1].start_time)} to {formatter.format_date(sessions[0].start_time)}")
+    output.append("\n".join(lines))
 
     # Tool usage summary
     if tool_counts:
-        console.print("\n[bold]Tool Usage Summary:[/bold]")
+        output.append("\n[bold]Tool Usage Summary:[/bold]")
         table = Table(show_header=True, header_style="bold")
         table.add_column("Tool", style="yellow")
         table.add_column("Total Uses", justify="right")
         table.add_column("Avg per Session", justify="right")
 
-        for name, count in sorted(tool_counts.items(), key=lambda x: -x[1])[:15]:
+        for name, count in tool_counts.most_common(top):
             avg = count / len(sessions) if sessions else 0
             table.add_row(name, str(count), f"{avg:.1f}")
 
-        console.print(table)
+        output.append(table)
 
     # Most modified files
-    if all_files_written:
-        console.print("\n[bold]Most Modified Files:[/bold]")
-        file_counts = {}
-        for f in all_files_written:
-            file_counts[f] = file_counts.get(f, 0) + 1
-
-        for f, count in sorted(file_counts.items(), key=lambda x: -x[1])[:10]:
-            console.print(f"  [cyan]{f}[/cyan] ({count}x)")
+    if file_counts:
+        lines = ["\n[bold]Most Modified Files:[/bold]"]
+        lines.extend(f"  [cyan]{f}[/cyan] ({count}x)" for f, count in file_counts.most_common(MAX_DISPLAY))
+        output.append("\n".join(lines))
 
     # Recent sessions preview
-    console.print("\n[bold]Recent Sessions:[/bold]")
+    lines = ["\n[bold]Recent Sessions:[/bold]"]
     for session_info in sessions[:5]:
         summary = formatter.truncate(session_info.first_message or "", 50)
-        console.print(f"  [{session_info.session_id[:8]}] {formatter.format_date(session_info.start_time)} - {summary}")
+        lines.append(f"  [{session_info.short_id}] {formatter.format_date(session_info.start_time)} - {summary}")
+    output.append("\n".join(lines))
 
-    console.print()
+    output.append("")
+
+    _print_renderables(console, output)
 
 
 @cli.command()
@@ -355,6 +452,11 @@ def recent(count, summary):
         claude-conversations recent
         claude-conversations recent -n 20 --summary
     """
+    from core import search
+    from . import formatter
+
+    console = _get_console()
+
     try:
         session_list = search.get_recent(n=count)
         formatter.format_sessions_table(session_list, summary=summary)
@@ -396,6 +498,9 @@ def stats():
     Examples:
         claude-conversations stats
     """
+    from core import index
+    from . import formatter
+
     stats_data = index.get_stats()
     formatter.format_stats(stats_data)
 
@@ -420,11 +525,18 @@ def rag_analyze(query, projects, list_analyses, show, model):
         claude-conversations rag-analyze --list
         claude-conversations rag-analyze --show abc12345
     """
-    from core import persistence
-    from rich.markdown import Markdown
+    console = _get_console()
+
+    # Imports are deferred to the branch that needs them so --list and
+    # --show skip loading the agents and Markdown renderer
 
     # List saved analyses
     if list_analyses:
+        from rich.table import Table
+
+        from core import persistence
+        from . import formatter
+
         analyses = persistence.list_analyses()
         if not analyses:
             console.print("[yellow]No saved analyses found.[/yellow]")
@@ -453,6 +565,9 @@ def rag_analyze(query, projects, list_analyses, show, model):
 
     # Show specific analysis
     if show:
+        from core import persistence
+        from rich.markdown import Markdown
+
         analysis = persistence.load_analysis(show)
         if not analysis:
             console.print(f"[red]Analysis not found:[/red] {show}")
@@ -473,8 +588,10 @@ def rag_analyze(query, projects, list_analyses, show, model):
         sys.exit(1)
 
     try:
+        from core import persistence, search
         from core.agents import run_analysis
         from rich.live import Live
+        from rich.markdown import Markdown
         from rich.panel import Panel
 
         # Create a live display for progress
@@ -526,11 +643,16 @@ def rag_analyze(query, projects, list_analyses, show, model):
             return
 
         # Extract project names from sessions
-        analyzed_projects = list(set(
-            s.project for s in [
-                search.get_session_by_id(sid) for sid in session_ids
-            ] if s
-        )) if session_ids else (projects.split(",") if projects else [])
+        fallback_projects = projects.split(",") if projects else []
+        if session_ids:
+            try:
+                analyzed_projects = sorted(set(
+                    search.get_projects_for_sessions(session_ids).values()
+                ))
+            except RuntimeError:
+                analyzed_projects = fallback_projects
+        else:
+            analyzed_projects = fallback_projects
 
         # Save analysis
         analysis_result = persistence.AnalysisResult.create(
@@ -566,6 +688,13 @@ def reindex(force):
         claude-conversations reindex
         claude-conversations reindex --force
     """
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
+    from core import index
+    from core.parser import get_projects_dir
+
+    console = _get_console()
+
     projects_dir = get_projects_dir()
 
     if not projects_dir.exists():
@@ -575,12 +704,26 @@ def reindex(force):
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
         console=console,
     ) as progress:
         task = progress.add_task("Indexing conversations...", total=None)
 
+        last_update = 0.0
+
         def progress_callback(current, total, session_id):
-            progress.update(task, description=f"Indexing {current}/{total}: {session_id[:8]}...")
+            # Repainting per session dominates large reindexes; throttle it
+            nonlocal last_update
+            now = time.monotonic()
+            if now - last_update < PROGRESS_REFRESH_INTERVAL and current != total:
+                return
+            last_update = now
+            progress.update(
+                task,
+                description=f"Indexing {current}/{total}: {session_id[:8]}...",
+                total=total,
+                completed=current,
+            )
 
         indexed, skipped = index.build_index(
             projects_dir=projects_dir,
@@ -588,6 +731,10 @@ def reindex(force):
             progress_callback=progress_callback
         )
 
+    if force or indexed >= OPTIMIZE_THRESHOLD:
+        with console.status("Optimizing index..."):
+            index.optimize_index()
+
     console.print()
     console.print(f"[green]Indexed:[/green] {indexed} sessions")
     console.print(f"[dim]Skipped (unchanged):[/dim] {skipped} sessions")
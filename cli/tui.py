@@ -2,18 +2,23 @@
 
 import fnmatch
 import re
+from collections import OrderedDict, deque
 from datetime import datetime
 from enum import Enum, auto
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Callable, Optional
 
 from rich.text import Text
 
 from textual.app import App, ComposeResult
+from textual.await_remove import AwaitRemove
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message as TextualMessage
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Input, Label, ListItem, ListView, Static
+from textual.worker import Worker, get_current_worker
 
 from core import index, search
 from core.parser import Message, Session, get_projects_dir
@@ -27,36 +32,65 @@ class ViewState(Enum):
     MESSAGES = auto()
 
 
+# Rows are recomposed every time a list is reloaded; parse each timestamp once
+@lru_cache(maxsize=8192)
 def format_date(ts: Optional[str]) -> str:
     """Format an ISO timestamp as just the date."""
     if not ts:
         return "N/A"
     try:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        # Python < 3.11 can't parse a "Z" suffix; only rebuild the string then
+        iso = ts[:-1] + "+00:00" if ts.endswith("Z") else ts
+        dt = datetime.fromisoformat(iso)
         return dt.strftime("%b %d")
     except (ValueError, AttributeError):
         return ts[:10] if len(ts) > 10 else ts
 
 
+@lru_cache(maxsize=8192)
 def format_timestamp(ts: Optional[str]) -> str:
     """Format an ISO timestamp for display."""
     if not ts:
         return "N/A"
     try:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        iso = ts[:-1] + "+00:00" if ts.endswith("Z") else ts
+        dt = datetime.fromisoformat(iso)
         return dt.strftime("%Y-%m-%d %H:%M")
     except (ValueError, AttributeError):
         return ts[:16] if len(ts) > 16 else ts
 
 
+@lru_cache(maxsize=8192)
+def format_session_row(
+    short_id: str,
+    start_time: Optional[str],
+    message_count: int,
+    first_message: Optional[str],
+) -> str:
+    """Format a session list row, once per distinct session."""
+    summary = (first_message or "").replace("\n", " ").strip()
+    return f"{short_id}  {format_date(start_time)}  {message_count:>3}  {summary}"
+
+
+@lru_cache(maxsize=1024)
+def format_search_row(project: str, snippet: str) -> str:
+    """Format a search result row without the FTS highlight markers."""
+    # Chained literal replaces beat a compiled regex on snippet-sized text
+    snippet = snippet.replace(">>>", "").replace("<<<", "")
+    snippet = snippet.replace("\n", " ").strip()
+    return f"[{project}] {snippet}"
+
+
 def truncate(text: str, max_len: int = 80) -> str:
     """Truncate text to max length with ellipsis."""
     if not text:
         return ""
-    text = text.replace("\n", " ").strip()
+    # Stripping first is equivalent (newlines are whitespace) and means only
+    # the kept prefix of a long message has its newlines replaced
+    text = text.strip()
     if len(text) <= max_len:
-        return text
-    return text[: max_len - 3] + "..."
+        return text.replace("\n", " ")
+    return text[:max_len - 3].replace("\n", " ") + "..."
 
 
 def matches_filter(name: str, pattern: str) -> bool:
@@ -67,21 +101,34 @@ def matches_filter(name: str, pattern: str) -> bool:
     - Regex patterns starting with ~ (e.g., "~^BUILT-git-repos")
     - Plain substring match otherwise
     """
+    return compile_project_filter(pattern)(name)
+
+
+@lru_cache(maxsize=128)
+def compile_project_filter(pattern: Optional[str]) -> Callable[[str], bool]:
+    """Compile a filter pattern into a predicate on project names.
+
+    Accepts the same syntax as matches_filter(), but parses the pattern once
+    so it can be applied to many names. Compiled filters are cached by pattern.
+    """
     if not pattern:
-        return True
+        return lambda name: True
 
     if pattern.startswith("~"):
         # Regex pattern
         try:
-            return bool(re.search(pattern[1:], name))
+            regex = re.compile(pattern[1:])
         except re.error:
-            return False
+            return lambda name: False
+        return lambda name: regex.search(name) is not None
     elif "*" in pattern or "?" in pattern:
         # Glob pattern
-        return fnmatch.fnmatch(name, pattern)
+        glob = re.compile(fnmatch.translate(pattern))
+        return lambda name: glob.match(name) is not None
     else:
         # Substring match
-        return pattern.lower() in name.lower()
+        needle = pattern.lower()
+        return lambda name: needle in name.lower()
 
 
 class AnalysisInputScreen(ModalScreen[str]):
@@ -141,14 +188,14 @@ class AnalysisInputScreen(ModalScreen[str]):
         self.query_one("#analysis-query", Input).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "analyze-btn":
-            query = self.query_one("#analysis-query", Input).value.strip()
-            if query:
-                self.dismiss(query)
-            else:
-                self.notify("Please enter a query", severity="warning")
-        else:
+        if event.button.id != "analyze-btn":
             self.dismiss("")
+            return
+        query = self.query_one("#analysis-query", Input).value.strip()
+        if not query:
+            self.notify("Please enter a query", severity="warning")
+            return
+        self.dismiss(query)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         query = event.value.strip()
@@ -195,11 +242,23 @@ class AnalysisProgressScreen(ModalScreen):
     }
     """
 
+    # Progress log icon per analysis stage
+    STAGE_ICONS = {
+        "starting": ">",
+        "decomposing": "?",
+        "searching": "@",
+        "chunking": "#",
+        "analyzing": "*",
+        "comparing": "=",
+        "complete": "!",
+    }
+
     def __init__(self, query: str, project_filter: str = None) -> None:
         super().__init__()
         self._query = query
         self._project_filter = project_filter
-        self._progress_lines: list[str] = []
+        # Keep last 20 lines
+        self._progress_lines: deque[str] = deque(maxlen=20)
         self._result: str = ""
         self._session_ids: list[str] = []
         self._analysis_id: str = ""
@@ -217,20 +276,8 @@ class AnalysisProgressScreen(ModalScreen):
 
     def _update_progress(self, stage: str, detail: str) -> None:
         """Update progress display (called from worker thread)."""
-        stage_icons = {
-            "starting": ">",
-            "decomposing": "?",
-            "searching": "@",
-            "chunking": "#",
-            "analyzing": "*",
-            "comparing": "=",
-            "complete": "!",
-        }
-        icon = stage_icons.get(stage, ".")
+        icon = self.STAGE_ICONS.get(stage, ".")
         self._progress_lines.append(f"[{icon}] {detail}")
-        # Keep last 20 lines
-        if len(self._progress_lines) > 20:
-            self._progress_lines = self._progress_lines[-20:]
 
         # Update UI from main thread
         self.call_from_thread(self._refresh_progress, stage, detail)
@@ -261,15 +308,14 @@ class AnalysisProgressScreen(ModalScreen):
             self._session_ids = session_ids
 
             if result:
-                # Get project names from sessions
-                analyzed_projects = []
-                for sid in session_ids:
-                    try:
-                        info = search.get_session_by_id(sid)
-                        if info and info.project not in analyzed_projects:
-                            analyzed_projects.append(info.project)
-                    except Exception:
-                        pass
+                # Get project names from sessions, in first-seen order
+                try:
+                    session_projects = search.get_projects_for_sessions(session_ids)
+                    analyzed_projects = list(dict.fromkeys(
+                        session_projects[sid] for sid in session_ids if sid in session_projects
+                    ))
+                except Exception:
+                    analyzed_projects = []
 
                 # Save analysis
                 analysis_result = persistence.AnalysisResult.create(
@@ -391,74 +437,121 @@ class ProjectItem(ListItem):
 class SessionItem(ListItem):
     """A session item in the sessions list."""
 
-    def __init__(self, session: SessionInfo, max_width: int = 60) -> None:
+    def __init__(self, session: SessionInfo) -> None:
         super().__init__()
         self.session = session
-        self._max_width = max_width
 
     def compose(self) -> ComposeResult:
-        date = format_date(self.session.start_time)
-        # Build with Rich Text, let CSS handle overflow
-        text = Text()
-        text.append(f"{self.session.session_id[:8]}  {date}  {self.session.message_count:>3}  ")
-        summary = (self.session.first_message or "").replace("\n", " ").strip()
-        text.append(summary)
-        yield Label(text)
+        session = self.session
+        row = format_session_row(
+            session.short_id, session.start_time, session.message_count, session.first_message
+        )
+        # Rich Text keeps the row out of markup parsing; CSS handles overflow
+        yield Label(Text(row))
 
 
 class MessageItem(ListItem):
     """A message item in the messages list."""
 
-    def __init__(self, message: Message, index: int, max_width: int = 60) -> None:
+    def __init__(self, message: Message, index: int) -> None:
         super().__init__()
         self.message = message
         self.index = index
-        self._max_width = max_width
-
-    def compose(self) -> ComposeResult:
-        # Build text with Rich Text for proper styling
-        text = Text()
-        text.append(f"{self.index:>3}. ")
-
-        # Color-coded roles
-        if self.message.role == "user":
-            text.append("USER", style="cyan")
-        else:
-            text.append("ASST", style="green")
-
-        # Tool count
-        tool_count = len(self.message.tool_use)
-        if tool_count:
-            text.append(f" [{tool_count} tools]", style="dim")
 
-        text.append("  ")
+    # Color-coded role labels, shared by every row
+    ROLE_LABELS = {"user": ("USER", "cyan")}
+    DEFAULT_ROLE_LABEL = ("ASST", "green")
 
-        # Content - just clean it up, let CSS handle overflow
-        content = (self.message.content or "").replace("\n", " ").strip()
-        text.append(content)
-
-        yield Label(text)
+    def compose(self) -> ComposeResult:
+        message = self.message
+        tool_count = len(message.tool_use)
+        # Assemble the styled row in one pass rather than append by append
+        yield Label(Text.assemble(
+            f"{self.index:>3}. ",
+            self.ROLE_LABELS.get(message.role, self.DEFAULT_ROLE_LABEL),
+            (f" [{tool_count} tools]", "dim") if tool_count else "",
+            "  ",
+            # Flattened once per message; CSS handles overflow
+            message.display_content,
+        ))
 
 
 class SearchResultItem(ListItem):
     """A search result item."""
 
-    def __init__(self, result: search.SearchResult, max_width: int = 60) -> None:
+    def __init__(self, result: search.SearchResult, session: Optional[SessionInfo] = None) -> None:
         super().__init__()
         self.result = result
-        self._max_width = max_width
+        self.session = session
 
     def compose(self) -> ComposeResult:
-        snippet = self.result.snippet.replace(">>>", "").replace("<<<", "")
-        snippet = snippet.replace("\n", " ").strip()
-        # Build with Rich Text, let CSS handle overflow
-        text = Text()
-        text.append(f"[{self.result.project}] ")
-        text.append(snippet)
-        yield Label(text)
+        row = format_search_row(self.result.project, self.result.snippet)
+        # Rich Text keeps the row out of markup parsing; CSS handles overflow
+        yield Label(Text(row))
 
 
-class ProjectsPane(ListView):
+class PagedListView(ListView):
+    """A ListView that mounts rows a page at a time.
+
+    The backing rows are kept as plain data and only turned into
+    ListItem widgets as the cursor or scroll position nears the end of
+    what is mounted, so long lists don't build every widget up front.
+    """
+
+    # Rows mounted per page
+    PAGE_SIZE = 50
+    # Mount the next page when the cursor is this close to the last row
+    PAGE_MARGIN = 10
+
+    def __init__(self, *, id: Optional[str] = None) -> None:
+        super().__init__(id=id)
+        self._rows: list = []
+        self._make_item: Callable[[int, object], ListItem] = lambda i, row: ListItem()
+        self._mounted_rows = 0
+
+    def show_rows(
+        self,
+        rows: list,
+        make_item: Callable[[int, object], ListItem],
+        count: Optional[int] = None,
+    ) -> None:
+        """Replace the list with rows, built by make_item(position, row) on demand.
+
+        Mounts the first count rows now (a page by default).
+        """
+        self.clear()
+        self._rows = rows
+        self._make_item = make_item
+        self._mount_more_rows(count)
+
+    def clear(self) -> AwaitRemove:
+        self._rows = []
+        self._mounted_rows = 0
+        return super().clear()
+
+    def _mount_more_rows(self, count: Optional[int] = None) -> None:
+        """Mount the next count rows (a page by default)."""
+        start = self._mounted_rows
+        end = min(len(self._rows), start + (count or self.PAGE_SIZE))
+        if end > start:
+            # One mount for the whole page rather than one per row
+            make_item, rows = self._make_item, self._rows
+            self.extend([make_item(position, rows[position]) for position in range(start, end)])
+        self._mounted_rows = end
+
+    def _mount_near_cursor(self) -> None:
+        """Mount another page if the cursor is close to the last mounted row."""
+        if self.index is not None and self.index >= self._mounted_rows - self.PAGE_MARGIN:
+            self._mount_more_rows()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        # Scrolling with the mouse doesn't move the cursor
+        if new_value >= self.max_scroll_y:
+            self._mount_more_rows()
+
+
+class ProjectsPane(PagedListView):
     """Pane showing all projects."""
 
     class ProjectHighlighted(TextualMessage):
@@ -479,6 +572,7 @@ class ProjectsPane(ListView):
         super().__init__(id="projects-pane")
         self._projects: list[ProjectInfo] = []
         self._project_filter = project_filter
+        self._matches_filter = compile_project_filter(project_filter)
 
     def on_mount(self) -> None:
         self.load_projects()
@@ -490,15 +584,12 @@ class ProjectsPane(ListView):
             # Apply filter if specified
             if self._project_filter:
                 self._projects = [
-                    p for p in all_projects
-                    if matches_filter(p.name, self._project_filter)
+                    p for p in all_projects if self._matches_filter(p.name)
                 ]
             else:
                 self._projects = all_projects
 
-            self.clear()
-            for project in self._projects:
-                self.append(ProjectItem(project))
+            self.show_rows(self._projects, lambda i, project: ProjectItem(project))
 
             # Update title to show filter
             if self._project_filter:
@@ -508,6 +599,7 @@ class ProjectsPane(ListView):
             self.append(ListItem(Label("Index not found. Run: claude-conversations reindex")))
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        self._mount_near_cursor()
         if event.item and isinstance(event.item, ProjectItem):
             self.post_message(self.ProjectHighlighted(event.item.project))
 
@@ -516,9 +608,12 @@ class ProjectsPane(ListView):
             self.post_message(self.ProjectSelected(event.item.project))
 
 
-class ContentPane(ListView):
+class ContentPane(PagedListView):
     """Pane showing sessions or messages depending on view state."""
 
+    # Projects whose session lists are kept for revisiting
+    SESSIONS_CACHE_SIZE = 16
+
     class SessionHighlighted(TextualMessage):
         """Sent when a session is highlighted."""
 
@@ -555,132 +650,129 @@ class ContentPane(ListView):
         self._current_project: Optional[str] = None
         self._current_session: Optional[Session] = None
         self._view_state = ViewState.SESSIONS
-        self._last_width: int = 0
         self._search_results: list[search.SearchResult] = []
+        self._sessions_cache: OrderedDict[str, list[SessionInfo]] = OrderedDict()
 
     @property
     def view_state(self) -> ViewState:
         return self._view_state
 
-    def _get_content_width(self) -> int:
-        """Get the available width for content, accounting for borders and padding."""
-        # Try scrollable_content_region first (actual viewport width)
-        try:
-            region_width = self.scrollable_content_region.width
-            if region_width > 10:
-                # This is the actual usable width, no subtraction needed
-                return max(20, region_width)
-        except Exception:
-            pass
-
-        # Fallback: size.width - border(2) - scrollbar(2) = 4
-        # Item padding is handled by CSS, not our text length
-        if self.size.width > 10:
-            return max(20, self.size.width - 4)
-        return 60
-
-    def on_resize(self, event) -> None:
-        """Rebuild list items when pane is resized."""
-        new_width = self._get_content_width()
-        # Only rebuild if width changed significantly (more than 5 chars)
-        if abs(new_width - self._last_width) > 5:
-            self._last_width = new_width
-            self._rebuild_items()
-
-    def _rebuild_items(self) -> None:
-        """Rebuild current list items with new width."""
-        width = self._get_content_width()
-        # Remember current index
-        current_index = self.index
-
-        if self._view_state == ViewState.MESSAGES and self._current_session:
-            self.clear()
-            for i, msg in enumerate(self._current_session.messages, 1):
-                self.append(MessageItem(msg, i, max_width=width))
-        elif self._search_results:
-            self.clear()
-            for result in self._search_results:
-                self.append(SearchResultItem(result, max_width=width))
-        elif self._sessions:
-            self.clear()
-            for session in self._sessions:
-                self.append(SessionItem(session, max_width=width))
-
-        # Restore selection if possible
-        if current_index is not None and current_index < len(self.children):
-            self.index = current_index
+    def _show_sessions(self) -> None:
+        """Show the current project's sessions."""
+        self.show_rows(self._sessions, lambda i, session: SessionItem(session))
 
     def load_sessions(self, project: str) -> None:
         """Load sessions for a project."""
         if project == self._current_project and self._view_state == ViewState.SESSIONS:
             return
+        self.workers.cancel_group(self, "messages")
         self._current_project = project
         self._current_session = None
         self._search_results = []
         self._view_state = ViewState.SESSIONS
         try:
-            self._sessions = search.get_sessions(project=project, limit=200)
-            self.clear()
-            width = self._get_content_width()
-            for session in self._sessions:
-                self.append(SessionItem(session, max_width=width))
+            self._sessions = self._get_sessions(project)
+            self._show_sessions()
             self.border_title = f"Sessions ({project})"
         except RuntimeError:
             self.clear()
 
+    def _get_sessions(self, project: str) -> list[SessionInfo]:
+        """Get a project's sessions, reusing recently loaded lists."""
+        sessions = self._sessions_cache.pop(project, None)
+        if sessions is None:
+            sessions = search.get_sessions(project=project, limit=200)
+        self._sessions_cache[project] = sessions
+        if len(self._sessions_cache) > self.SESSIONS_CACHE_SIZE:
+            self._sessions_cache.popitem(last=False)
+        return sessions
+
+    def clear_sessions_cache(self) -> None:
+        """Forget cached session lists, e.g. after a reindex."""
+        self._sessions_cache.clear()
+
     def load_messages(self, session_info: SessionInfo) -> None:
-        """Load messages for a session."""
+        """Load messages for a session.
+
+        The session file is parsed in a worker thread so large sessions
+        don't freeze the UI; the messages replace the list once loaded.
+        """
         self._view_state = ViewState.MESSAGES
+        self.border_title = f"Messages ({session_info.short_id}) - loading..."
+        self.run_worker(
+            partial(self._load_session, session_info),
+            group="messages",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _load_session(self, session_info: SessionInfo) -> None:
+        """Worker to parse a session in a background thread."""
+        worker = get_current_worker()
         try:
-            self._current_session = search.load_session(session_info.session_id)
-            self.clear()
-            width = self._get_content_width()
-            for i, msg in enumerate(self._current_session.messages, 1):
-                self.append(MessageItem(msg, i, max_width=width))
-            self.border_title = f"Messages ({session_info.session_id[:8]}) - {len(self._current_session.messages)} msgs"
+            session = search.load_session(session_info.session_id)
         except (RuntimeError, ValueError) as e:
-            self.clear()
-            self.append(ListItem(Label(f"Error loading session: {e}")))
+            self.app.call_from_thread(self._show_load_error, worker, e)
+            return
+        self.app.call_from_thread(self._show_messages, worker, session_info, session)
+
+    def _show_messages(self, worker: Worker, session_info: SessionInfo, session: Session) -> None:
+        """Show a loaded session's messages unless the user moved on."""
+        if worker.is_cancelled:
+            return
+        self._current_session = session
+        self.show_rows(session.messages, lambda i, msg: MessageItem(msg, i + 1))
+        self.border_title = f"Messages ({session_info.short_id}) - {len(session.messages)} msgs"
+
+    def _show_load_error(self, worker: Worker, error: Exception) -> None:
+        """Show why a session failed to load unless the user moved on."""
+        if worker.is_cancelled:
+            return
+        self.clear()
+        self.append(ListItem(Label(f"Error loading session: {error}")))
 
     def go_back_to_sessions(self) -> bool:
         """Go back to sessions view. Returns True if we were in messages view."""
+        self.workers.cancel_group(self, "messages")
         if self._view_state == ViewState.MESSAGES and self._current_project:
             self._view_state = ViewState.SESSIONS
             self._current_session = None
-            self.clear()
-            width = self._get_content_width()
-            for session in self._sessions:
-                self.append(SessionItem(session, max_width=width))
+            self._show_sessions()
             self.border_title = f"Sessions ({self._current_project})"
             return True
         return False
 
-    def load_search_results(self, results: list[search.SearchResult]) -> None:
-        """Load search results instead of sessions."""
+    def load_search_results(
+        self,
+        results: list[search.SearchResult],
+        sessions: dict[str, SessionInfo],
+    ) -> None:
+        """Load search results instead of sessions.
+
+        sessions maps the results' session IDs to their SessionInfo, so
+        moving through the results needs no further index lookups.
+        """
+        self.workers.cancel_group(self, "messages")
         self._current_project = None
         self._current_session = None
         self._sessions = []
         self._search_results = results
         self._view_state = ViewState.SESSIONS
-        self.clear()
-        width = self._get_content_width()
-        for result in results:
-            self.append(SearchResultItem(result, max_width=width))
+        self.show_rows(
+            results, lambda i, result: SearchResultItem(result, sessions.get(result.session_id))
+        )
         self.border_title = f"Search Results ({len(results)})"
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        self._mount_near_cursor()
         if event.item and isinstance(event.item, SessionItem):
             self.post_message(self.SessionHighlighted(event.item.session))
         elif event.item and isinstance(event.item, MessageItem):
             if self._current_session:
                 self.post_message(self.MessageHighlighted(event.item.message, self._current_session))
         elif event.item and isinstance(event.item, SearchResultItem):
-            try:
-                session_info = search.get_session_by_id(event.item.result.session_id)
-                if session_info:
-                    self.post_message(self.SessionHighlighted(session_info))
-            except (RuntimeError, ValueError):
-                pass
+            if event.item.session:
+                self.post_message(self.SessionHighlighted(event.item.session))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.item and isinstance(event.item, SessionItem):
@@ -689,12 +781,8 @@ class ContentPane(ListView):
             if self._current_session:
                 self.post_message(self.MessageSelected(event.item.message, self._current_session))
         elif event.item and isinstance(event.item, SearchResultItem):
-            try:
-                session_info = search.get_session_by_id(event.item.result.session_id)
-                if session_info:
-                    self.post_message(self.SessionSelected(session_info))
-            except (RuntimeError, ValueError):
-                pass
+            if event.item.session:
+                self.post_message(self.SessionSelected(event.item.session))
 
 
 class PreviewPane(VerticalScroll):
@@ -703,45 +791,69 @@ class PreviewPane(VerticalScroll):
     def __init__(self) -> None:
         super().__init__(id="preview-pane")
         self._content = Static("Select an item to preview", id="preview-content")
+        self._shown_message: Optional[Message] = None
 
     def compose(self) -> ComposeResult:
         yield self._content
 
     def show_session(self, session: SessionInfo) -> None:
-        """Show session preview."""
+        """Show session preview.
+
+        The index is queried in a worker thread; highlighting another
+        item before it finishes discards the stale preview.
+        """
+        self._shown_message = None
+        self.run_worker(
+            partial(self._load_session_preview, session),
+            group="preview",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _load_session_preview(self, session: SessionInfo) -> None:
+        """Build a session preview (runs in a worker thread)."""
+        worker = get_current_worker()
+
         # Build tool usage summary
         tool_summary = ""
         try:
-            full_session = search.load_session(session.session_id)
-            tool_counts: dict[str, int] = {}
-            for msg in full_session.messages:
-                for tool in msg.tool_use:
-                    name = tool["name"]
-                    tool_counts[name] = tool_counts.get(name, 0) + 1
+            # Counts come pre-aggregated from the index; no session file is read
+            tool_counts, _ = search.aggregate_tool_usage([session.session_id])
             if tool_counts:
-                top_tools = sorted(tool_counts.items(), key=lambda x: -x[1])[:4]
+                top_tools = tool_counts.most_common(4)
                 tool_summary = " | Tools: " + ", ".join(
                     f"{name}({count})" for name, count in top_tools
                 )
-        except (RuntimeError, ValueError):
+        except RuntimeError:
             pass
 
-        preview_text = f"""Session {session.session_id[:8]} - {session.project} - {format_timestamp(session.start_time)}
+        preview_text = f"""Session {session.short_id} - {session.project} - {format_timestamp(session.start_time)}
 Messages: {session.message_count}{tool_summary}
 
 First message: "{truncate(session.first_message or '', 80)}"
 
 Press Enter to view messages"""
-        self._content.update(preview_text)
+        self.app.call_from_thread(self._update_preview, worker, preview_text)
+
+    def _update_preview(self, worker: Worker, preview_text: str) -> None:
+        """Show a worker's preview unless it was superseded meanwhile."""
+        if not worker.is_cancelled:
+            self._content.update(Text(preview_text))
 
     def show_message(self, message: Message, session: Session) -> None:
         """Show message preview with full content."""
+        self.workers.cancel_group(self, "preview")
+        # Re-highlighting the message already shown (e.g. when rows are
+        # remounted) would re-render up to 3000 chars for nothing
+        if message is self._shown_message:
+            return
         role = "USER" if message.role == "user" else "ASSISTANT"
 
-        lines = []
-        lines.append(f"[{role}] {format_timestamp(message.timestamp)}")
-        lines.append(f"Session: {session.session_id[:8]} - {session.project}")
-        lines.append("-" * 60)
+        lines = [
+            f"[{role}] {format_timestamp(message.timestamp)}",
+            f"Session: {session.session_id[:8]} - {session.project}",
+            "-" * 60,
+        ]
 
         # Show content
         if message.content:
@@ -761,10 +873,17 @@ Press Enter to view messages"""
             if len(message.tool_use) > 5:
                 lines.append(f"  ... and {len(message.tool_use) - 5} more")
 
-        self._content.update("\n".join(lines))
+        # Plain Text skips markup parsing, which also dropped "[USER]" and
+        # any bracketed message content as unknown style tags
+        text = Text("\n".join(lines))
+        text.stylize("cyan" if message.role == "user" else "green", 0, len(role) + 2)
+        self._content.update(text)
+        self._shown_message = message
 
     def clear_preview(self) -> None:
         """Clear the preview."""
+        self.workers.cancel_group(self, "preview")
+        self._shown_message = None
         self._content.update("Select an item to preview")
 
 
@@ -846,65 +965,95 @@ class ConversationBrowser(App):
         Binding("ctrl+a", "rag_analyze", "RAG Analyze"),
     ]
 
+    # Seconds a project must stay highlighted before its sessions load
+    PROJECT_HIGHLIGHT_DELAY = 0.15
+
     def __init__(self, project_filter: Optional[str] = None) -> None:
         super().__init__()
         self._project_filter = project_filter
         self._current_project: Optional[ProjectInfo] = None
         self._view_state = ViewState.PROJECTS
+        self._load_sessions_timer: Optional[Timer] = None
+        # (query, results, sessions) of the last completed search
+        self._last_search: Optional[
+            tuple[str, list[search.SearchResult], dict[str, SessionInfo]]
+        ] = None
+        # Set in compose(), so handlers skip a DOM query on every key press
+        self._projects_pane: ProjectsPane
+        self._content_pane: ContentPane
+        self._preview_pane: PreviewPane
+        self._search_input: Input
 
     def compose(self) -> ComposeResult:
         yield Header()
         with Horizontal(id="main"):
-            projects_pane = ProjectsPane(project_filter=self._project_filter)
-            projects_pane.border_title = "Projects"
-            yield projects_pane
-            content_pane = ContentPane()
-            content_pane.border_title = "Sessions"
-            yield content_pane
-        preview_pane = PreviewPane()
-        preview_pane.border_title = "Preview"
-        yield preview_pane
+            self._projects_pane = ProjectsPane(project_filter=self._project_filter)
+            self._projects_pane.border_title = "Projects"
+            yield self._projects_pane
+            self._content_pane = ContentPane()
+            self._content_pane.border_title = "Sessions"
+            yield self._content_pane
+        self._preview_pane = PreviewPane()
+        self._preview_pane.border_title = "Preview"
+        yield self._preview_pane
         with Horizontal(id="search-container"):
-            yield Input(placeholder="Search conversations... (press / to focus)", id="search-input")
+            self._search_input = Input(
+                placeholder="Search conversations... (press / to focus)", id="search-input"
+            )
+            yield self._search_input
         yield Footer()
 
     def on_projects_pane_project_highlighted(
         self, event: ProjectsPane.ProjectHighlighted
     ) -> None:
-        """When a project is highlighted, load its sessions."""
+        """When a project is highlighted, load its sessions.
+
+        Loading is debounced so arrowing through the project list only
+        queries the project the cursor settles on.
+        """
         self._current_project = event.project
-        content_pane = self.query_one("#content-pane", ContentPane)
-        content_pane.load_sessions(event.project.name)
+        if self._load_sessions_timer is not None:
+            self._load_sessions_timer.stop()
+        self._load_sessions_timer = self.set_timer(
+            self.PROJECT_HIGHLIGHT_DELAY, self._load_current_project_sessions
+        )
+
+    def _load_current_project_sessions(self) -> None:
+        """Load the sessions of the highlighted project."""
+        self._load_sessions_timer = None
+        if self._current_project is None:
+            return
+        self._content_pane.load_sessions(self._current_project.name)
         self._view_state = ViewState.SESSIONS
 
     def on_projects_pane_project_selected(
         self, event: ProjectsPane.ProjectSelected
     ) -> None:
         """When a project is selected, focus the content pane."""
-        content_pane = self.query_one("#content-pane", ContentPane)
-        content_pane.focus()
+        # Don't wait out the highlight delay
+        if self._load_sessions_timer is not None:
+            self._load_sessions_timer.stop()
+            self._load_current_project_sessions()
+        self._content_pane.focus()
 
     def on_content_pane_session_highlighted(
         self, event: ContentPane.SessionHighlighted
     ) -> None:
         """When a session is highlighted, show preview."""
-        preview_pane = self.query_one("#preview-pane", PreviewPane)
-        preview_pane.show_session(event.session)
+        self._preview_pane.show_session(event.session)
 
     def on_content_pane_session_selected(
         self, event: ContentPane.SessionSelected
     ) -> None:
         """When a session is selected, load its messages."""
-        content_pane = self.query_one("#content-pane", ContentPane)
-        content_pane.load_messages(event.session)
+        self._content_pane.load_messages(event.session)
         self._view_state = ViewState.MESSAGES
 
     def on_content_pane_message_highlighted(
         self, event: ContentPane.MessageHighlighted
     ) -> None:
         """When a message is highlighted, show its content."""
-        preview_pane = self.query_one("#preview-pane", PreviewPane)
-        preview_pane.show_message(event.message, event.session)
+        self._preview_pane.show_message(event.message, event.session)
 
     def on_content_pane_message_selected(
         self, event: ContentPane.MessageSelected
@@ -921,50 +1070,86 @@ class ConversationBrowser(App):
         if not query:
             return
 
+        if self._last_search is not None and self._last_search[0] == query:
+            # Resubmitting the last query; reuse its results
+            self.workers.cancel_group(self, "search")
+            _, results, sessions = self._last_search
+            self._display_search_results(results, sessions)
+        else:
+            # Query the index off the event loop so typing isn't blocked
+            self.run_worker(
+                partial(self._run_search, query),
+                group="search",
+                exclusive=True,
+                thread=True,
+            )
+
+        # Clear the input
+        event.input.value = ""
+
+    def _run_search(self, query: str) -> None:
+        """Worker to run a search in a background thread."""
+        worker = get_current_worker()
         try:
             results = search.search(query, limit=50)
-            content_pane = self.query_one("#content-pane", ContentPane)
-            content_pane.load_search_results(results)
-            self._view_state = ViewState.SESSIONS
-            if results:
-                content_pane.focus()
-                self.notify(f"Found {len(results)} results")
-            else:
-                self.notify("No results found", severity="warning")
+            # Resolve every result's session up front, in one query
+            sessions = search.get_sessions_by_ids(
+                list({result.session_id for result in results})
+            )
         except RuntimeError as e:
-            self.notify(f"Search error: {e}", severity="error")
+            self.call_from_thread(self.notify, f"Search error: {e}", severity="error")
+            return
+        self.call_from_thread(self._show_search_results, worker, query, results, sessions)
+
+    def _show_search_results(
+        self,
+        worker: Worker,
+        query: str,
+        results: list[search.SearchResult],
+        sessions: dict[str, SessionInfo],
+    ) -> None:
+        """Show search results unless a newer search replaced this one."""
+        if worker.is_cancelled:
+            return
 
-        # Clear the input
-        event.input.value = ""
+        self._last_search = (query, results, sessions)
+        self._display_search_results(results, sessions)
+
+    def _display_search_results(
+        self,
+        results: list[search.SearchResult],
+        sessions: dict[str, SessionInfo],
+    ) -> None:
+        """Show search results in the content pane."""
+        self._content_pane.load_search_results(results, sessions)
+        self._view_state = ViewState.SESSIONS
+        if results:
+            self._content_pane.focus()
+            self.notify(f"Found {len(results)} results")
+        else:
+            self.notify("No results found", severity="warning")
 
     def action_focus_search(self) -> None:
         """Focus the search input."""
-        search_input = self.query_one("#search-input", Input)
-        search_input.focus()
+        self._search_input.focus()
 
     def action_go_back(self) -> None:
         """Go back in navigation."""
-        content_pane = self.query_one("#content-pane", ContentPane)
-
         # If in messages view, go back to sessions
-        if content_pane.go_back_to_sessions():
+        if self._content_pane.go_back_to_sessions():
             self._view_state = ViewState.SESSIONS
             return
 
         # If in sessions view, focus projects pane
-        projects_pane = self.query_one("#projects-pane", ProjectsPane)
-        projects_pane.focus()
+        self._projects_pane.focus()
         self._view_state = ViewState.PROJECTS
 
     def action_switch_pane(self) -> None:
         """Switch focus between projects and content panes."""
-        projects_pane = self.query_one("#projects-pane", ProjectsPane)
-        content_pane = self.query_one("#content-pane", ContentPane)
-
-        if projects_pane.has_focus:
-            content_pane.focus()
+        if self._projects_pane.has_focus:
+            self._content_pane.focus()
         else:
-            projects_pane.focus()
+            self._projects_pane.focus()
 
     def action_reindex(self) -> None:
         """Reindex conversations and reload projects."""
@@ -978,8 +1163,9 @@ class ConversationBrowser(App):
             indexed, skipped = index.build_index(projects_dir=projects_dir, force=False)
 
             # Reload projects pane
-            projects_pane = self.query_one("#projects-pane", ProjectsPane)
-            projects_pane.load_projects()
+            self._content_pane.clear_sessions_cache()
+            self._last_search = None
+            self._projects_pane.load_projects()
 
             self.notify(f"Reindexed {indexed} sessions ({skipped} unchanged)")
         except Exception as e:
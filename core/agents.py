@@ -352,6 +352,24 @@ class RAGAnalyzer:
         projects: list[str] = None,
     ) -> list[Session]:
         """Search for sessions matching the queries."""
+        try:
+            # Reuse one index connection for every session lookup
+            with search.bulk_session_loader() as load_session:
+                sessions = self._collect_sessions(queries, projects, load_session)
+        except RuntimeError as e:
+            self._log("searching", f"Search error: {e}")
+            sessions = []
+
+        self._log("searching", f"Total unique sessions found: {len(sessions)}")
+        return sessions
+
+    def _collect_sessions(
+        self,
+        queries: list[str],
+        projects: Optional[list[str]],
+        load_session: Callable[[str], Session],
+    ) -> list[Session]:
+        """Run each query and load the unique sessions it finds."""
         all_sessions = {}  # session_id -> Session (deduplicate)
 
         for query in queries:
@@ -370,7 +388,7 @@ class RAGAnalyzer:
                         for result in results:
                             if result.session_id not in all_sessions:
                                 try:
-                                    session = search.load_session(result.session_id)
+                                    session = load_session(result.session_id)
                                     all_sessions[result.session_id] = session
                                     self._log("searching", f"    Found: {session.session_id[:8]} ({session.message_count} msgs)")
                                 except ValueError:
@@ -386,7 +404,7 @@ class RAGAnalyzer:
                     for result in results[:10]:  # Limit sessions loaded per query
                         if result.session_id not in all_sessions:
                             try:
-                                session = search.load_session(result.session_id)
+                                session = load_session(result.session_id)
                                 all_sessions[result.session_id] = session
                                 self._log("searching", f"  Found: {session.session_id[:8]} in {session.project}")
                             except ValueError:
@@ -394,9 +412,7 @@ class RAGAnalyzer:
                 except RuntimeError as e:
                     self._log("searching", f"Search error: {e}")
 
-        sessions = list(all_sessions.values())
-        self._log("searching", f"Total unique sessions found: {len(sessions)}")
-        return sessions
+        return list(all_sessions.values())
 
     def analyze(
         self,
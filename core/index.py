@@ -1,11 +1,15 @@
 """SQLite FTS5 index for fast full-text search."""
 
 import sqlite3
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
 from .parser import Session, iter_sessions, parse_session, get_projects_dir
 
+# Bump when the schema changes so existing sessions get reindexed
+SCHEMA_VERSION = 2
+
 
 def get_db_path() -> Path:
     """Get the default database path."""
@@ -18,6 +22,15 @@ def init_db(db_path: Path) -> sqlite3.Connection:
     """Initialize the database with required tables."""
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # WAL persists in the file, so readers (e.g. the TUI) never block on a
+    # reindex; NORMAL sync is safe under WAL and avoids an fsync per commit
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 2:
+        # tool_uses held one row per call before counts were pre-aggregated
+        conn.execute("DROP TABLE IF EXISTS tool_uses")
 
     # Create sessions table
     conn.execute("""
@@ -53,11 +66,40 @@ def init_db(db_path: Path) -> sqlite3.Connection:
         ON sessions(project)
     """)
 
+    # LIKE is case-insensitive, so only a NOCASE index lets prefix patterns
+    # such as "webapp*" use a range scan instead of checking every row
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_project_nocase
+        ON sessions(project COLLATE NOCASE)
+    """)
+
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_sessions_start_time
         ON sessions(start_time DESC)
     """)
 
+    # Per-session call counts for each (tool, file) pair, aggregated at index
+    # time so analysis can sum them without reparsing JSONL
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tool_uses (
+            session_id TEXT NOT NULL,
+            tool_name TEXT,
+            file_path TEXT,
+            count INTEGER NOT NULL
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tool_uses_session
+        ON tool_uses(session_id, tool_name)
+    """)
+
+    # Sessions indexed under an older schema lack newer tables; clear their
+    # mtimes so the next build_index() picks them up again
+    if version < SCHEMA_VERSION:
+        conn.execute("UPDATE sessions SET file_mtime = 0")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     conn.commit()
     return conn
 
@@ -87,6 +129,10 @@ def index_session(conn: sqlite3.Connection, session: Session) -> None:
         "DELETE FROM messages WHERE session_id = ?",
         (session.session_id,)
     )
+    conn.execute(
+        "DELETE FROM tool_uses WHERE session_id = ?",
+        (session.session_id,)
+    )
 
     # Insert session metadata
     conn.execute("""
@@ -122,6 +168,24 @@ def index_session(conn: sqlite3.Connection, session: Session) -> None:
                 msg.line_number,
             ))
 
+    # Insert tool call counts for aggregate analysis
+    tool_counts = Counter()
+    for msg in session.messages:
+        for tool in msg.tool_use:
+            input_data = tool.get("input")
+            if not isinstance(input_data, dict):
+                input_data = {}
+            tool_counts[tool.get("name"), input_data.get("file_path")] += 1
+    if tool_counts:
+        conn.executemany("""
+            INSERT INTO tool_uses (
+                session_id, tool_name, file_path, count
+            ) VALUES (?, ?, ?, ?)
+        """, [
+            (session.session_id, name, file_path, count)
+            for (name, file_path), count in tool_counts.items()
+        ])
+
     conn.commit()
 
 
@@ -180,6 +244,23 @@ def build_index(
     return indexed, skipped
 
 
+def optimize_index(db_path: Optional[Path] = None) -> None:
+    """Compact the index after a large update.
+
+    Merges the FTS5 segments left behind by bulk inserts into one, and
+    refreshes the query planner statistics for the regular tables.
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO messages(messages) VALUES('optimize')")
+    conn.execute("ANALYZE sessions")
+    conn.execute("ANALYZE tool_uses")
+    conn.commit()
+    conn.close()
+
+
 def get_stats(db_path: Optional[Path] = None) -> dict:
     """Get statistics from the index."""
     if db_path is None:
@@ -242,8 +323,9 @@ def clear_index(db_path: Optional[Path] = None) -> None:
         db_path = get_db_path()
 
     if db_path.exists():
-        conn = sqlite3.connect(db_path)
+        conn = init_db(db_path)
         conn.execute("DELETE FROM messages")
         conn.execute("DELETE FROM sessions")
+        conn.execute("DELETE FROM tool_uses")
         conn.commit()
         conn.close()
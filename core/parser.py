@@ -3,9 +3,19 @@
 import json
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+
+# Tools whose input carries a file_path that gets written
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit", "MultiEdit"})
 
 
 @dataclass
@@ -28,6 +38,11 @@ class Message:
     tool_results: list = field(default_factory=list)
     thinking: Optional[str] = None
 
+    @cached_property
+    def display_content(self) -> str:
+        """Content flattened onto one line for list rows, computed once."""
+        return (self.content or "").replace("\n", " ").strip()
+
 
 @dataclass
 class Session:
@@ -58,6 +73,18 @@ class Session:
     def message_count(self) -> int:
         return len(self.messages)
 
+    @cached_property
+    def rendered_rows(self) -> list[tuple["Message", bool, Optional[list], Optional[list]]]:
+        """Per-message (message, is_user, tool_use, tool_results) tuples.
+
+        Computed once and shared by the transcript formatters. tool_use and
+        tool_results are None when the message has none.
+        """
+        return [
+            (msg, msg.role == "user", msg.tool_use or None, msg.tool_results or None)
+            for msg in self.messages
+        ]
+
 
 def get_project_name(project_path: Path) -> str:
     """Extract a readable project name from the path-encoded directory name.
@@ -190,19 +217,33 @@ def extract_tool_results(message_data: dict) -> list[dict]:
     return results
 
 
-def extract_code_blocks(content: str) -> list[CodeBlock]:
-    """Extract fenced code blocks from content."""
-    pattern = r"```(\w*)\n(.*?)```"
-    blocks = []
+_CODE_FENCE_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
 
-    for match in re.finditer(pattern, content, re.DOTALL):
+def iter_code_blocks(content: str) -> Iterator[CodeBlock]:
+    """Yield fenced code blocks from content as they are found."""
+    # Substring search is far cheaper than running the regex engine, and
+    # most messages contain no fences at all
+    if "```" not in content:
+        return
+
+    line_num = 1
+    pos = 0
+
+    for match in _CODE_FENCE_RE.finditer(content):
         language = match.group(1) or "text"
         code = match.group(2).rstrip()
-        # Approximate line number based on position
-        line_num = content[:match.start()].count('\n') + 1
-        blocks.append(CodeBlock(language=language, code=code, line_number=line_num))
+        # Approximate line number based on position, counting only the
+        # newlines since the previous match instead of rescanning the prefix
+        start = match.start()
+        line_num += content.count('\n', pos, start)
+        pos = start
+        yield CodeBlock(language=language, code=code, line_number=line_num)
+
 
-    return blocks
+def extract_code_blocks(content: str) -> list[CodeBlock]:
+    """Extract fenced code blocks from content."""
+    return list(iter_code_blocks(content))
 
 
 def parse_session(jsonl_path: Path) -> Session:
@@ -267,6 +308,63 @@ def parse_session(jsonl_path: Path) -> Session:
     return session
 
 
+def _loads_line(line: bytes):
+    """Decode one raw JSONL line, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # Fall back for input orjson rejects, e.g. NaN
+    return json.loads(line)
+
+
+def iter_tool_uses(jsonl_path: Path) -> Iterator[tuple[Optional[str], dict]]:
+    """Stream (name, input) pairs for each tool call in a session file.
+
+    Unlike parse_session(), this never builds Message objects. Lines are
+    scanned as raw bytes, so those that cannot contain a tool call are
+    skipped without being decoded at all.
+    """
+    for name, tool_input, _ in iter_tool_calls(jsonl_path):
+        yield name, tool_input
+
+
+def iter_tool_calls(
+    jsonl_path: Path,
+    tool_name: Optional[str] = None,
+) -> Iterator[tuple[Optional[str], dict, Optional[str]]]:
+    """Stream (name, input, timestamp) for each tool call in a session file.
+
+    If tool_name is given, only calls to that tool are yielded, and lines
+    that never mention the name are skipped before decoding.
+    """
+    needle = b'"tool_use"'
+    name_needle = None
+    if tool_name is not None:
+        name_needle = json.dumps(tool_name, ensure_ascii=False).encode('utf-8')
+
+    with open(jsonl_path, 'rb', buffering=1 << 16) as f:
+        for line in f:
+            if needle not in line:
+                continue
+            if name_needle is not None and name_needle not in line:
+                continue
+
+            try:
+                data = _loads_line(line)
+            except ValueError:
+                continue
+
+            if data.get("type") not in ("user", "assistant"):
+                continue
+
+            timestamp = data.get("timestamp")
+            for tool in extract_tool_use(data.get("message", {})):
+                if tool_name is not None and tool["name"] != tool_name:
+                    continue
+                yield tool["name"], tool["input"], timestamp
+
+
 def iter_sessions(projects_dir: Path) -> "Generator[Path, None, None]":
     """Iterate over all session JSONL files in the projects directory."""
     if not projects_dir.exists():
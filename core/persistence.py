@@ -1,9 +1,11 @@
 """Persistence layer for RAG analysis results."""
 
+import heapq
 import json
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -88,9 +90,8 @@ def list_analyses(limit: int = 50) -> list[AnalysisResult]:
         except (json.JSONDecodeError, TypeError, KeyError):
             continue  # Skip invalid files
 
-    # Sort by created_at descending
-    analyses.sort(key=lambda a: a.created_at, reverse=True)
-    return analyses[:limit]
+    # Newest first; selecting the top `limit` avoids sorting every analysis
+    return heapq.nlargest(limit, analyses, key=attrgetter("created_at"))
 
 
 def load_analysis(analysis_id: str) -> Optional[AnalysisResult]:
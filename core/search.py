@@ -2,12 +2,16 @@
 
 import re
 import sqlite3
-from dataclasses import dataclass
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
+from . import parser
 from .index import get_db_path, init_db
-from .parser import parse_session, Session
+from .parser import FILE_WRITE_TOOLS, parse_session, Session
 
 
 def sanitize_fts_query(query: str) -> str:
@@ -38,6 +42,10 @@ class SearchResult:
     content: str
     line_number: int
     snippet: str  # Highlighted snippet from FTS5
+    short_id: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.short_id = self.session_id[:8]
 
 
 @dataclass
@@ -51,6 +59,10 @@ class SessionInfo:
     end_time: Optional[str]
     message_count: int
     file_path: str
+    short_id: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.short_id = self.session_id[:8]
 
 
 @dataclass
@@ -63,6 +75,10 @@ class ProjectInfo:
     first_active: Optional[str]
 
 
+# Bytes of the index file SQLite may memory-map for reads
+MMAP_SIZE = 256 * 1024 * 1024
+
+
 def ensure_index(db_path: Optional[Path] = None) -> sqlite3.Connection:
     """Ensure the index exists and return a connection."""
     if db_path is None:
@@ -75,6 +91,9 @@ def ensure_index(db_path: Optional[Path] = None) -> sqlite3.Connection:
 
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # Read through a memory map and sort in memory; both are per-connection
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
 
@@ -234,12 +253,45 @@ def get_projects(
 ) -> list[ProjectInfo]:
     """Get all projects with statistics.
 
+    Results are cached until the index file changes.
+
     Args:
         db_path: Optional database path
 
     Returns:
         List of ProjectInfo objects, sorted by last_active descending
     """
+    if db_path is None:
+        db_path = get_db_path()
+
+    try:
+        version = _index_version(db_path)
+    except FileNotFoundError:
+        version = None  # ensure_index() reports the missing index
+
+    return list(_get_projects_cached(db_path, version))
+
+
+def _index_version(db_path: Path) -> tuple:
+    """Identify the index contents by the size and mtime of its files.
+
+    Writes land in the write-ahead log until a checkpoint copies them into
+    the main file, so both are part of the key.
+    """
+    stat = db_path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    if wal_path.exists():
+        wal_stat = wal_path.stat()
+        version += (wal_stat.st_mtime_ns, wal_stat.st_size)
+
+    return version
+
+
+@lru_cache(maxsize=4)
+def _get_projects_cached(db_path: Path, version: Optional[tuple]) -> list[ProjectInfo]:
+    """Query project statistics, memoized on the index version."""
     conn = ensure_index(db_path)
 
     sql = """
@@ -281,9 +333,23 @@ def get_session_by_id(
 
     Returns:
         SessionInfo if found, None otherwise
+
+    Raises:
+        ValueError: If a partial ID matches more than one session
     """
     conn = ensure_index(db_path)
+    try:
+        return _lookup_session(conn, session_id)
+    finally:
+        conn.close()
+
 
+def _lookup_session(conn: sqlite3.Connection, session_id: str) -> Optional[SessionInfo]:
+    """Look up a session by full or partial ID on an open connection.
+
+    Raises:
+        ValueError: If a partial ID matches more than one session
+    """
     # Try exact match first
     cursor = conn.execute(
         "SELECT * FROM sessions WHERE session_id = ?",
@@ -291,15 +357,17 @@ def get_session_by_id(
     )
     row = cursor.fetchone()
 
-    # Try prefix match if exact match fails
-    if row is None:
-        cursor = conn.execute(
-            "SELECT * FROM sessions WHERE session_id LIKE ? LIMIT 1",
-            (f"{session_id}%",)
-        )
-        row = cursor.fetchone()
-
-    conn.close()
+    # Try prefix match if exact match fails. A range on the primary key is
+    # an index seek, where LIKE (case-insensitive) would scan every row.
+    if row is None and session_id:
+        upper = session_id[:-1] + chr(ord(session_id[-1]) + 1)
+        rows = conn.execute(
+            "SELECT * FROM sessions WHERE session_id >= ? AND session_id < ? LIMIT 2",
+            (session_id, upper)
+        ).fetchall()
+        if len(rows) > 1:
+            raise ValueError(f"Ambiguous session ID: {session_id}")
+        row = rows[0] if rows else None
 
     if row is None:
         return None
@@ -316,9 +384,265 @@ def get_session_by_id(
     )
 
 
+# Stay well under SQLite's default host parameter limit (999)
+_IN_CHUNK_SIZE = 900
+
+
+def aggregate_tool_usage(
+    session_ids: list[str],
+    db_path: Optional[Path] = None,
+) -> tuple[Counter, Counter]:
+    """Aggregate tool usage across sessions from the index.
+
+    Args:
+        session_ids: Full session IDs to aggregate over
+        db_path: Optional database path
+
+    Returns:
+        Tuple of Counters: (tool name -> call count, written file path -> write count)
+
+    Raises:
+        RuntimeError: If the index predates the tool_uses table
+    """
+    conn = ensure_index(db_path)
+
+    tool_counts: Counter = Counter()
+    file_counts: Counter = Counter()
+
+    try:
+        for start in range(0, len(session_ids), _IN_CHUNK_SIZE):
+            chunk = session_ids[start:start + _IN_CHUNK_SIZE]
+            marks = ",".join("?" * len(chunk))
+
+            # One scan per chunk yields both tool and written-file counts
+            cursor = conn.execute(f"""
+                SELECT tool_name, file_path, SUM(count) as count
+                FROM tool_uses
+                WHERE session_id IN ({marks})
+                GROUP BY tool_name, file_path
+            """, chunk)
+            for tool_name, file_path, count in cursor:
+                tool_counts[tool_name] += count
+                if file_path and tool_name in FILE_WRITE_TOOLS:
+                    file_counts[file_path] += count
+    except sqlite3.OperationalError as e:
+        # Indexes from before schema 2 lack the table or its count column
+        if "no such table" in str(e) or "no such column" in str(e):
+            raise RuntimeError(
+                "Search index is out of date. Run 'claude-conversations reindex' first."
+            )
+        raise
+    finally:
+        conn.close()
+
+    return tool_counts, file_counts
+
+
+def get_sessions_by_ids(
+    session_ids: list[str],
+    db_path: Optional[Path] = None,
+) -> dict[str, SessionInfo]:
+    """Look up many full session IDs in batched queries.
+
+    Args:
+        session_ids: Full session IDs
+        db_path: Optional database path
+
+    Returns:
+        Dict of session_id -> SessionInfo for the sessions found in the index
+    """
+    conn = ensure_index(db_path)
+
+    sessions = {}
+    for start in range(0, len(session_ids), _IN_CHUNK_SIZE):
+        chunk = session_ids[start:start + _IN_CHUNK_SIZE]
+        marks = ",".join("?" * len(chunk))
+        cursor = conn.execute(f"""
+            SELECT
+                session_id, project, slug, first_message,
+                start_time, end_time, message_count, file_path
+            FROM sessions
+            WHERE session_id IN ({marks})
+        """, chunk)
+        for row in cursor:
+            sessions[row["session_id"]] = SessionInfo(
+                session_id=row["session_id"],
+                project=row["project"],
+                slug=row["slug"],
+                first_message=row["first_message"],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                message_count=row["message_count"],
+                file_path=row["file_path"],
+            )
+
+    conn.close()
+    return sessions
+
+
+def get_projects_for_sessions(
+    session_ids: list[str],
+    db_path: Optional[Path] = None,
+) -> dict[str, str]:
+    """Map full session IDs to their project names in batched queries.
+
+    Args:
+        session_ids: Full session IDs
+        db_path: Optional database path
+
+    Returns:
+        Dict of session_id -> project for the sessions found in the index
+    """
+    conn = ensure_index(db_path)
+
+    projects = {}
+    for start in range(0, len(session_ids), _IN_CHUNK_SIZE):
+        chunk = session_ids[start:start + _IN_CHUNK_SIZE]
+        marks = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"SELECT session_id, project FROM sessions WHERE session_id IN ({marks})",
+            chunk,
+        )
+        for row in cursor:
+            projects[row["session_id"]] = row["project"]
+
+    conn.close()
+    return projects
+
+
+def iter_tool_uses(
+    session_id: str,
+    db_path: Optional[Path] = None,
+) -> Iterator[tuple[Optional[str], dict]]:
+    """Stream (name, input) pairs for a session's tool calls.
+
+    Reads the session file line by line instead of loading the full
+    Session, for callers that only need tool names and inputs.
+
+    Args:
+        session_id: Full or partial session ID
+        db_path: Optional database path
+
+    Raises:
+        ValueError: If session not found
+    """
+    info = get_session_by_id(session_id, db_path)
+    if info is None:
+        raise ValueError(f"Session not found: {session_id}")
+
+    file_path = Path(info.file_path)
+    if not file_path.exists():
+        raise ValueError(f"Session file not found: {file_path}")
+
+    return parser.iter_tool_uses(file_path)
+
+
+def iter_tool_calls(
+    session_id: str,
+    tool_name: Optional[str] = None,
+    db_path: Optional[Path] = None,
+) -> Iterator[tuple[Optional[str], dict, Optional[str]]]:
+    """Stream (name, input, timestamp) for a session's tool calls.
+
+    Tool inputs are not stored in the index, so the session file is read
+    line by line; with tool_name set, lines for other tools are skipped
+    without being decoded.
+
+    Args:
+        session_id: Full or partial session ID
+        tool_name: Only yield calls to this tool
+        db_path: Optional database path
+
+    Raises:
+        ValueError: If session not found
+    """
+    info = get_session_by_id(session_id, db_path)
+    if info is None:
+        raise ValueError(f"Session not found: {session_id}")
+
+    file_path = Path(info.file_path)
+    if not file_path.exists():
+        raise ValueError(f"Session file not found: {file_path}")
+
+    return parser.iter_tool_calls(file_path, tool_name)
+
+
+def iter_message_contents(
+    session_id: str,
+    db_path: Optional[Path] = None,
+) -> Iterator[str]:
+    """Stream the non-empty message contents of a session in order.
+
+    Contents come straight from the index when it is up to date with the
+    session file, so no JSONL is parsed. A session modified since the
+    last reindex falls back to parsing the file.
+
+    Args:
+        session_id: Full or partial session ID
+        db_path: Optional database path
+
+    Raises:
+        ValueError: If session not found
+    """
+    info = get_session_by_id(session_id, db_path)
+    if info is None:
+        raise ValueError(f"Session not found: {session_id}")
+
+    file_path = Path(info.file_path)
+    if not file_path.exists():
+        raise ValueError(f"Session file not found: {file_path}")
+
+    return _iter_message_contents(info.session_id, file_path, db_path)
+
+
+def _iter_message_contents(
+    session_id: str,
+    file_path: Path,
+    db_path: Optional[Path],
+) -> Iterator[str]:
+    """Yield indexed message contents, or parsed ones if the index is stale."""
+    conn = ensure_index(db_path)
+    try:
+        row = conn.execute(
+            "SELECT file_mtime FROM sessions WHERE session_id = ?",
+            (session_id,)
+        ).fetchone()
+
+        if file_path.stat().st_mtime > row["file_mtime"]:
+            for msg in parse_session(file_path).messages:
+                if msg.content:
+                    yield msg.content
+            return
+
+        # A column-filtered MATCH uses the FTS index; equality alone would
+        # scan every indexed message
+        phrase = session_id.replace('"', '""')
+        cursor = conn.execute("""
+            SELECT content FROM messages
+            WHERE messages MATCH ? AND session_id = ?
+            ORDER BY rowid
+        """, (f'session_id : "{phrase}"', session_id))
+        for row in cursor:
+            yield row["content"]
+    finally:
+        conn.close()
+
+
+# Parsed sessions kept in memory, so revisiting one (e.g. in the TUI) is free
+SESSION_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=SESSION_CACHE_SIZE)
+def _parse_session_cached(file_path: Path, file_mtime: float) -> Session:
+    """Parse a session file, memoized on its path and modification time."""
+    return parse_session(file_path)
+
+
 def load_session(session_id: str, db_path: Optional[Path] = None) -> Session:
     """Load a full session from disk.
 
+    Parsed sessions are cached in memory until their file changes.
+
     Args:
         session_id: Full or partial session ID
         db_path: Optional database path
@@ -337,4 +661,37 @@ def load_session(session_id: str, db_path: Optional[Path] = None) -> Session:
     if not file_path.exists():
         raise ValueError(f"Session file not found: {file_path}")
 
-    return parse_session(file_path)
+    return _parse_session_cached(file_path, file_path.stat().st_mtime)
+
+
+@contextmanager
+def bulk_session_loader(
+    db_path: Optional[Path] = None,
+) -> Iterator[Callable[[str], Session]]:
+    """Load many sessions over a single index connection.
+
+    Yields a function with the same contract as load_session(), so loops
+    that load session after session reuse one connection (and SQLite's
+    cached statements) instead of reconnecting for every lookup.
+
+    Example:
+        with bulk_session_loader() as load:
+            sessions = [load(sid) for sid in session_ids]
+    """
+    conn = ensure_index(db_path)
+
+    def load(session_id: str) -> Session:
+        info = _lookup_session(conn, session_id)
+        if info is None:
+            raise ValueError(f"Session not found: {session_id}")
+
+        file_path = Path(info.file_path)
+        if not file_path.exists():
+            raise ValueError(f"Session file not found: {file_path}")
+
+        return parse_session(file_path)
+
+    try:
+        yield load
+    finally:
+        conn.close()
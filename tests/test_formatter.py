@@ -0,0 +1,118 @@
+"""Tests for cli/formatter.py - terminal output formatting."""
+
+from pathlib import Path
+
+import pytest
+
+from cli import formatter
+from core.parser import Message, Session
+from core.search import ProjectInfo, SessionInfo
+
+
+@pytest.fixture
+def transcript_cache(tmp_path, monkeypatch):
+    """Point the on-disk transcript cache at a temporary directory."""
+    pytest.importorskip("diskcache")
+    monkeypatch.setattr(formatter, "TRANSCRIPT_CACHE_DIR", tmp_path / "cache")
+    formatter._transcript_cache.cache_clear()
+    yield formatter._transcript_cache()
+    formatter._transcript_cache().close()
+    formatter._transcript_cache.cache_clear()
+
+
+def _session():
+    """Build a small session with one tool call."""
+    return Session(
+        session_id="abcdef1234567890",
+        project="proj",
+        slug=None,
+        file_path=Path("/tmp/x.jsonl"),
+        file_mtime=1700000000.0,
+        messages=[
+            Message(role="user", content="Fix the *login* page",
+                    timestamp="2024-01-15T10:00:00Z"),
+            Message(role="assistant", content="Done.", timestamp="2024-01-15T10:01:00Z",
+                    tool_use=[{"name": "Edit", "input": {"file_path": "/src/login.py"}}]),
+        ],
+        start_time="2024-01-15T10:00:00Z",
+        end_time="2024-01-15T10:01:00Z",
+    )
+
+
+class TestPipedTables:
+    """Tests for plain-text table output when stdout is not a terminal."""
+
+    def test_sessions_table_tab_separated(self, capsys):
+        """Sessions should print as tab-separated rows with a header."""
+        sessions = [
+            SessionInfo(
+                session_id="abcdef1234567890",
+                project="proj",
+                slug=None,
+                first_message="First\nmessage",
+                start_time="2024-01-15T10:00:00Z",
+                end_time=None,
+                message_count=7,
+                file_path="/tmp/x.jsonl",
+            )
+        ]
+        formatter.format_sessions_table(sessions, summary=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "Session ID\tProject\tDate\tMessages\tFirst Message"
+        assert lines[1] == "abcdef12\tproj\t2024-01-15\t7\tFirst message"
+
+    def test_projects_table_tab_separated(self, capsys):
+        """Projects should print as tab-separated rows with a header."""
+        projects = [ProjectInfo("proj", 2, 10, "2024-01-15T10:00:00Z", "2024-01-01T10:00:00Z")]
+        formatter.format_projects_table(projects, stats=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "Project\tSessions\tLast Active\tMessages\tFirst Active"
+        assert lines[1] == "proj\t2\t2024-01-15\t10\t2024-01-01"
+
+
+class TestTranscriptCache:
+    """Tests for the persistent transcript cache."""
+
+    @pytest.mark.parametrize("output_format", ["text", "md", "json"])
+    def test_cache_hit_matches_fresh_render(self, transcript_cache, output_format):
+        """A cached transcript should be identical to the one first rendered."""
+        session = _session()
+        fresh = formatter.format_transcript(session, output_format=output_format)
+        assert len(transcript_cache) == 1
+
+        cached = formatter.format_transcript(session, output_format=output_format)
+
+        assert cached == fresh
+        assert len(transcript_cache) == 1
+
+    def test_cache_version_bump_rerenders(self, transcript_cache, monkeypatch):
+        """Entries from an older formatter version should not be served."""
+        session = _session()
+        formatter.format_transcript(session)
+        monkeypatch.setattr(formatter, "TRANSCRIPT_CACHE_VERSION", formatter.TRANSCRIPT_CACHE_VERSION + 1)
+
+        formatter.format_transcript(session)
+
+        assert len(transcript_cache) == 2
+
+    def test_cache_hit_streams_in_blocks(self, transcript_cache, monkeypatch):
+        """A cache hit should be read back in blocks, not as one string."""
+        monkeypatch.setattr(formatter, "TRANSCRIPT_CACHE_BLOCK_SIZE", 32)
+        session = _session()
+        fresh = list(formatter.iter_transcript(session))
+
+        cached = list(formatter.iter_transcript(session))
+
+        assert len(cached) > 1
+        assert all(len(chunk) <= 32 for chunk in cached)
+        assert "".join(cached) == "".join(fresh)
+
+    def test_abandoned_render_is_not_cached(self, transcript_cache):
+        """A transcript the caller stops reading early should not be cached."""
+        chunks = formatter.iter_transcript(_session())
+        next(chunks)
+        chunks.close()
+
+        assert len(transcript_cache) == 0
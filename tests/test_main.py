@@ -0,0 +1,88 @@
+"""Tests for cli/main.py - command wiring and startup."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cli.main import cli
+from core import index
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def indexed_home(tmp_path, monkeypatch):
+    """Index one session using three different tools under a temporary HOME."""
+    project_dir = tmp_path / ".claude" / "projects" / "-Users-alice-Projects-webapp"
+    project_dir.mkdir(parents=True)
+    entries = [
+        {"type": "user", "timestamp": "2024-01-15T09:59:00Z",
+         "message": {"role": "user", "content": "Fix the login page"}},
+    ]
+    for name in ("Bash", "Bash", "Bash", "Read", "Read", "Grep"):
+        entries.append({
+            "type": "assistant",
+            "timestamp": "2024-01-15T10:00:00Z",
+            "message": {"role": "assistant", "content": [
+                {"type": "tool_use", "id": "t1", "name": name, "input": {}},
+            ]},
+        })
+    with open(project_dir / "aaaa1111-0000.jsonl", "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    index.build_index(projects_dir=project_dir.parent, db_path=index.get_db_path())
+    return tmp_path
+
+
+class TestStartup:
+    """Tests for import-time cost of the CLI entry point."""
+
+    def test_entry_point_defers_heavy_imports(self):
+        """Importing the command group should not load Rich or core modules."""
+        code = (
+            "import sys, cli.main; "
+            "print(sorted(m for m in sys.modules "
+            "if m.split('.')[0] in ('rich', 'core', 'textual')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_help_lists_commands(self):
+        """--help should render without running any command body."""
+        result = CliRunner().invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("search", "read", "extract", "analyze", "rag-analyze", "reindex"):
+            assert name in result.output
+
+
+class TestAnalyzeTop:
+    """Tests for analyze --project --top."""
+
+    def test_top_limits_tools_table(self, indexed_home):
+        """Only the N most used tools should be listed."""
+        result = CliRunner().invoke(cli, ["analyze", "--project", "*webapp*", "--top", "2"])
+
+        assert result.exit_code == 0, result.output
+        assert "Bash" in result.output
+        assert "Read" in result.output
+        assert "Grep" not in result.output
+
+    @pytest.mark.parametrize("top", ["0", "-3"])
+    def test_top_must_be_positive(self, indexed_home, top):
+        """A non-positive --top should be rejected rather than print an empty table."""
+        result = CliRunner().invoke(cli, ["analyze", "--project", "*webapp*", "--top", top])
+
+        assert result.exit_code == 2
+        assert "--top" in result.output
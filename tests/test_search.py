@@ -0,0 +1,341 @@
+"""Tests for core/search.py and core/index.py - index queries."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from core import index, search
+
+
+def _write_session(path, entries):
+    """Write JSONL entries to a session file."""
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _tool_entry(name, tool_input, timestamp="2024-01-15T10:00:00Z"):
+    """Build an assistant JSONL entry with a single tool call."""
+    return {
+        "type": "assistant",
+        "timestamp": timestamp,
+        "message": {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Running {name}"},
+                {"type": "tool_use", "id": "t1", "name": name, "input": tool_input},
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def indexed_db(tmp_path):
+    """Build an index over two small sessions and return its path."""
+    project_dir = tmp_path / "projects" / "-Users-alice-Projects-webapp"
+    project_dir.mkdir(parents=True)
+
+    _write_session(project_dir / "aaaa1111-0000.jsonl", [
+        {"type": "user", "timestamp": "2024-01-15T09:59:00Z",
+         "message": {"role": "user", "content": "Fix the login page"}},
+        _tool_entry("Edit", {"file_path": "/src/login.py"}),
+        _tool_entry("Edit", {"file_path": "/src/login.py"}),
+        _tool_entry("Bash", {"command": "pytest"}),
+    ])
+    _write_session(project_dir / "bbbb2222-0000.jsonl", [
+        {"type": "user", "timestamp": "2024-01-16T09:59:00Z",
+         "message": {"role": "user", "content": "Add a signup page"}},
+        _tool_entry("Write", {"file_path": "/src/signup.py"}, "2024-01-16T10:00:00Z"),
+        _tool_entry("Read", {"file_path": "/src/login.py"}, "2024-01-16T10:01:00Z"),
+    ])
+
+    db_path = tmp_path / "index.db"
+    index.build_index(projects_dir=tmp_path / "projects", db_path=db_path)
+    return db_path
+
+
+class TestGetProjects:
+    """Tests for get_projects."""
+
+    def test_repeat_calls_are_cached(self, indexed_db, monkeypatch):
+        """An unchanged index should not be queried again."""
+        first = search.get_projects(db_path=indexed_db)
+
+        def fail(db_path=None):
+            raise AssertionError("index queried again")
+
+        monkeypatch.setattr(search, "ensure_index", fail)
+        assert search.get_projects(db_path=indexed_db) == first
+
+    def test_reindex_refreshes(self, indexed_db, tmp_path):
+        """Projects added by a reindex should show up."""
+        search.get_projects(db_path=indexed_db)
+
+        project_dir = tmp_path / "projects" / "-Users-alice-Projects-api"
+        project_dir.mkdir()
+        _write_session(project_dir / "cccc3333-0000.jsonl", [
+            {"type": "user", "timestamp": "2024-01-18T09:59:00Z",
+             "message": {"role": "user", "content": "Add an endpoint"}},
+        ])
+        index.build_index(projects_dir=tmp_path / "projects", db_path=indexed_db)
+
+        names = [p.name for p in search.get_projects(db_path=indexed_db)]
+        assert names == ["api", "webapp"]
+
+
+class TestGetSessionById:
+    """Tests for get_session_by_id."""
+
+    def test_resolves_prefix(self, indexed_db):
+        """A unique prefix should resolve to the full session."""
+        info = search.get_session_by_id("bbbb", db_path=indexed_db)
+
+        assert info.session_id == "bbbb2222-0000"
+
+    def test_unknown_prefix(self, indexed_db):
+        """A prefix matching no session should return None."""
+        assert search.get_session_by_id("cccc", db_path=indexed_db) is None
+
+    def test_ambiguous_prefix(self, indexed_db, tmp_path):
+        """A prefix shared by several sessions should raise ValueError."""
+        project_dir = tmp_path / "projects" / "-Users-alice-Projects-webapp"
+        _write_session(project_dir / "aaaa1111-9999.jsonl", [
+            {"type": "user", "timestamp": "2024-01-17T09:59:00Z",
+             "message": {"role": "user", "content": "Another session"}},
+        ])
+        index.build_index(projects_dir=tmp_path / "projects", db_path=indexed_db)
+
+        with pytest.raises(ValueError, match="Ambiguous session ID"):
+            search.get_session_by_id("aaaa1111", db_path=indexed_db)
+        assert search.get_session_by_id("aaaa1111-0000", db_path=indexed_db).session_id == "aaaa1111-0000"
+
+
+class TestAggregateToolUsage:
+    """Tests for aggregate_tool_usage."""
+
+    def test_counts_across_sessions(self, indexed_db):
+        """Tool and written-file counts should sum over all given sessions."""
+        tool_counts, file_counts = search.aggregate_tool_usage(
+            ["aaaa1111-0000", "bbbb2222-0000"], db_path=indexed_db
+        )
+
+        assert tool_counts == {"Edit": 2, "Bash": 1, "Write": 1, "Read": 1}
+        assert file_counts == {"/src/login.py": 2, "/src/signup.py": 1}
+
+    def test_limited_to_given_sessions(self, indexed_db):
+        """Only the requested sessions should be aggregated."""
+        tool_counts, file_counts = search.aggregate_tool_usage(
+            ["bbbb2222-0000"], db_path=indexed_db
+        )
+
+        assert tool_counts == {"Write": 1, "Read": 1}
+        assert file_counts == {"/src/signup.py": 1}
+
+    def test_multiedit_counts_as_write(self, tmp_path):
+        """MultiEdit calls should count toward written files like Edit."""
+        project_dir = tmp_path / "projects" / "-Users-alice-Projects-webapp"
+        project_dir.mkdir(parents=True)
+        _write_session(project_dir / "cccc3333-0000.jsonl", [
+            _tool_entry("MultiEdit", {"file_path": "/src/app.py", "edits": []}),
+            _tool_entry("Edit", {"file_path": "/src/app.py"}),
+        ])
+        db_path = tmp_path / "index.db"
+        index.build_index(projects_dir=tmp_path / "projects", db_path=db_path)
+
+        _, file_counts = search.aggregate_tool_usage(["cccc3333-0000"], db_path=db_path)
+
+        assert file_counts == {"/src/app.py": 2}
+
+    def test_reindex_replaces_rows(self, indexed_db, tmp_path):
+        """Forcing a reindex should not duplicate tool rows."""
+        index.build_index(projects_dir=tmp_path / "projects", db_path=indexed_db, force=True)
+
+        tool_counts, _ = search.aggregate_tool_usage(["aaaa1111-0000"], db_path=indexed_db)
+        assert tool_counts == {"Edit": 2, "Bash": 1}
+
+    def test_rows_are_preaggregated(self, indexed_db):
+        """Repeated calls on the same file should be stored as one counted row."""
+        conn = sqlite3.connect(indexed_db)
+        rows = conn.execute(
+            "SELECT tool_name, file_path, count FROM tool_uses "
+            "WHERE session_id = 'aaaa1111-0000' ORDER BY tool_name"
+        ).fetchall()
+        conn.close()
+
+        assert rows == [("Bash", None, 1), ("Edit", "/src/login.py", 2)]
+
+    def test_old_schema_is_reindexed(self, indexed_db, tmp_path):
+        """Opening an index from an older schema should force a reindex."""
+        conn = sqlite3.connect(indexed_db)
+        conn.execute("DROP TABLE tool_uses")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+
+        with pytest.raises(RuntimeError, match="reindex"):
+            search.aggregate_tool_usage(["aaaa1111-0000"], db_path=indexed_db)
+
+        indexed, skipped = index.build_index(projects_dir=tmp_path / "projects", db_path=indexed_db)
+        assert (indexed, skipped) == (2, 0)
+
+    def test_per_call_rows_are_reindexed(self, indexed_db):
+        """A tool_uses table without counts (schema 1) should ask for a reindex."""
+        conn = sqlite3.connect(indexed_db)
+        conn.execute("DROP TABLE tool_uses")
+        conn.execute("CREATE TABLE tool_uses (session_id TEXT, tool_name TEXT, file_path TEXT)")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+
+        with pytest.raises(RuntimeError, match="reindex"):
+            search.aggregate_tool_usage(["aaaa1111-0000"], db_path=indexed_db)
+
+
+class TestIterToolUses:
+    """Tests for iter_tool_uses."""
+
+    def test_yields_tool_calls_in_order(self, indexed_db):
+        """Should yield (name, input) for each tool call in file order."""
+        tools = list(search.iter_tool_uses("aaaa1111", db_path=indexed_db))
+
+        assert tools == [
+            ("Edit", {"file_path": "/src/login.py"}),
+            ("Edit", {"file_path": "/src/login.py"}),
+            ("Bash", {"command": "pytest"}),
+        ]
+
+    def test_unknown_session(self, indexed_db):
+        """An unknown session ID should raise ValueError."""
+        with pytest.raises(ValueError, match="Session not found"):
+            search.iter_tool_uses("zzzz", db_path=indexed_db)
+
+
+class TestIterToolCalls:
+    """Tests for iter_tool_calls."""
+
+    def test_filters_by_tool_name(self, indexed_db):
+        """Only calls to the named tool should be yielded, with timestamps."""
+        tools = list(search.iter_tool_calls("aaaa1111", "Bash", db_path=indexed_db))
+
+        assert tools == [("Bash", {"command": "pytest"}, "2024-01-15T10:00:00Z")]
+
+    def test_name_in_other_field_is_not_matched(self, indexed_db):
+        """A tool name mentioned outside the name field should not match."""
+        assert list(search.iter_tool_calls("aaaa1111", "Running", db_path=indexed_db)) == []
+
+
+class TestGetProjectsForSessions:
+    """Tests for get_projects_for_sessions."""
+
+    def test_maps_found_sessions(self, indexed_db):
+        """Known session IDs map to their project; unknown IDs are omitted."""
+        projects = search.get_projects_for_sessions(
+            ["aaaa1111-0000", "bbbb2222-0000", "missing"], db_path=indexed_db
+        )
+
+        assert projects == {"aaaa1111-0000": "webapp", "bbbb2222-0000": "webapp"}
+
+
+class TestGetSessionsByIds:
+    """Tests for get_sessions_by_ids."""
+
+    def test_maps_found_sessions(self, indexed_db):
+        """Known session IDs map to their SessionInfo; unknown IDs are omitted."""
+        sessions = search.get_sessions_by_ids(
+            ["aaaa1111-0000", "bbbb2222-0000", "missing"], db_path=indexed_db
+        )
+
+        assert sorted(sessions) == ["aaaa1111-0000", "bbbb2222-0000"]
+        assert sessions["bbbb2222-0000"].first_message == "Add a signup page"
+
+
+class TestBulkSessionLoader:
+    """Tests for bulk_session_loader."""
+
+    def test_loads_sessions_by_prefix(self, indexed_db):
+        """The loader should resolve partial IDs like load_session."""
+        with search.bulk_session_loader(db_path=indexed_db) as load:
+            sessions = [load("aaaa1111"), load("bbbb2222-0000")]
+
+        assert [s.session_id for s in sessions] == ["aaaa1111-0000", "bbbb2222-0000"]
+        assert sessions[1].messages[0].content == "Add a signup page"
+
+    def test_unknown_session(self, indexed_db):
+        """An unknown session ID should raise ValueError."""
+        with search.bulk_session_loader(db_path=indexed_db) as load:
+            with pytest.raises(ValueError, match="Session not found"):
+                load("zzzz")
+
+
+class TestIterMessageContents:
+    """Tests for iter_message_contents."""
+
+    def test_streams_indexed_contents_in_order(self, indexed_db):
+        """Should yield each non-empty message content in session order."""
+        contents = list(search.iter_message_contents("aaaa1111", db_path=indexed_db))
+
+        assert contents == [
+            "Fix the login page", "Running Edit", "Running Edit", "Running Bash",
+        ]
+
+    def test_stale_index_reads_file(self, indexed_db, tmp_path):
+        """A session changed since indexing should be read from disk."""
+        session_file = tmp_path / "projects" / "-Users-alice-Projects-webapp" / "bbbb2222-0000.jsonl"
+        with open(session_file, "a") as f:
+            f.write(json.dumps(_tool_entry("Bash", {"command": "ls"})) + "\n")
+        stat = session_file.stat()
+        os.utime(session_file, (stat.st_atime, stat.st_mtime + 10))
+
+        contents = list(search.iter_message_contents("bbbb2222", db_path=indexed_db))
+
+        assert contents[-1] == "Running Bash"
+        assert len(contents) == 4
+
+    def test_unknown_session(self, indexed_db):
+        """An unknown session ID should raise ValueError."""
+        with pytest.raises(ValueError, match="Session not found"):
+            search.iter_message_contents("zzzz", db_path=indexed_db)
+
+
+class TestLoadSession:
+    """Tests for load_session."""
+
+    def test_repeat_loads_are_cached(self, indexed_db):
+        """Loading the same session twice should not reparse the file."""
+        first = search.load_session("aaaa1111", db_path=indexed_db)
+        second = search.load_session("aaaa1111-0000", db_path=indexed_db)
+
+        assert second is first
+
+    def test_modified_file_is_reparsed(self, indexed_db, tmp_path):
+        """A session file changed on disk should be parsed again."""
+        first = search.load_session("bbbb2222", db_path=indexed_db)
+
+        session_file = tmp_path / "projects" / "-Users-alice-Projects-webapp" / "bbbb2222-0000.jsonl"
+        with open(session_file, "a") as f:
+            f.write(json.dumps(_tool_entry("Bash", {"command": "ls"})) + "\n")
+        stat = session_file.stat()
+        os.utime(session_file, (stat.st_atime, stat.st_mtime + 10))
+
+        second = search.load_session("bbbb2222", db_path=indexed_db)
+
+        assert second is not first
+        assert len(second.messages) == len(first.messages) + 1
+
+
+class TestOptimizeIndex:
+    """Tests for optimize_index."""
+
+    def test_optimized_index_still_searchable(self, indexed_db):
+        """Optimizing should gather planner stats and keep FTS results intact."""
+        before = [r.session_id for r in search.search("signup", db_path=indexed_db)]
+
+        index.optimize_index(db_path=indexed_db)
+
+        conn = sqlite3.connect(indexed_db)
+        stat_tables = {row[0] for row in conn.execute("SELECT tbl FROM sqlite_stat1")}
+        conn.close()
+        assert {"sessions", "tool_uses"} <= stat_tables
+        assert [r.session_id for r in search.search("signup", db_path=indexed_db)] == before